@@ -10,10 +10,13 @@ Available tools:
 - paper_batch_details
 - paper_authors
 - paper_citations
+- paper_citations_all
 - paper_references
+- paper_references_all
 - author_search
 - author_details
 - author_papers
+- author_papers_all
 - author_batch_details
 - get_paper_recommendations_single
 - get_paper_recommendations_multi
@@ -11,13 +11,16 @@ from .papers import (
     paper_batch_details,
     paper_authors,
     paper_citations,
-    paper_references
+    paper_citations_all,
+    paper_references,
+    paper_references_all
 )
 
 from .authors import (
     author_search,
     author_details,
     author_papers,
+    author_papers_all,
     author_batch_details
 )
 
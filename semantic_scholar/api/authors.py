@@ -6,8 +6,9 @@ from typing import Dict, List, Optional
 
 from fastmcp import Context
 
-from ..config import ErrorType
+from ..config import Config, ErrorType
 from ..core.client import S2Client, make_compat_client
+from ..core.coalesce import AuthorDetailsCoalescer
 from ..core.exceptions import S2ApiError, S2Error, S2ValidationError
 from ..core.requests import (
     AuthorBatchDetailsRequest,
@@ -20,6 +21,9 @@ from ..utils.errors import create_error_response, s2_exception_to_error_response
 from ..utils.http import make_request
 
 
+_author_coalescer = AuthorDetailsCoalescer(window=Config.AUTHOR_COALESCE_WINDOW)
+
+
 def _client() -> S2Client:
     return make_compat_client(make_request)
 
@@ -54,11 +58,11 @@ async def author_details(
 ) -> Dict:
     try:
         request = AuthorDetailsRequest(author_id=author_id, fields=fields)
-        return await _client().get_author(request)
+        return await _author_coalescer.get_author(_client(), request)
     except S2ValidationError as exc:
         return s2_exception_to_error_response(exc)
     except S2ApiError as exc:
-        if "404" in exc.message:
+        if exc.status_code == 404:
             return create_error_response(
                 ErrorType.VALIDATION,
                 "Author not found",
@@ -88,7 +92,32 @@ async def author_papers(
     except S2ValidationError as exc:
         return s2_exception_to_error_response(exc)
     except S2ApiError as exc:
-        if "404" in exc.message:
+        if exc.status_code == 404:
+            return create_error_response(
+                ErrorType.VALIDATION,
+                "Author not found",
+                {"author_id": author_id},
+            )
+        return s2_exception_to_error_response(exc)
+    except S2Error as exc:
+        return s2_exception_to_error_response(exc)
+
+
+@mcp.tool()
+async def author_papers_all(
+    context: Context,
+    author_id: str,
+    fields: Optional[List[str]] = None,
+    limit: int = 1000,
+    max_pages: int = 10,
+) -> Dict:
+    try:
+        request = AuthorPapersRequest(author_id=author_id, fields=fields, limit=limit)
+        return await _client().get_author_papers_all(request, max_pages=max_pages)
+    except S2ValidationError as exc:
+        return s2_exception_to_error_response(exc)
+    except S2ApiError as exc:
+        if exc.status_code == 404:
             return create_error_response(
                 ErrorType.VALIDATION,
                 "Author not found",
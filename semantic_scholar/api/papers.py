@@ -127,7 +127,7 @@ async def paper_title_search(
     except S2ValidationError as exc:
         return s2_exception_to_error_response(exc)
     except S2ApiError as exc:
-        if "404" in exc.message:
+        if exc.status_code == 404:
             return create_error_response(
                 ErrorType.VALIDATION,
                 "No matching paper found",
@@ -150,7 +150,7 @@ async def paper_details(
     except S2ValidationError as exc:
         return s2_exception_to_error_response(exc)
     except S2ApiError as exc:
-        if "404" in exc.message:
+        if exc.status_code == 404:
             return create_error_response(
                 ErrorType.VALIDATION,
                 "Paper not found",
@@ -176,94 +176,74 @@ async def paper_batch_details(
         return s2_exception_to_error_response(exc)
 
 
-@mcp.tool()
-async def paper_authors(
-    context: Context,
-    paper_id: str,
-    fields: Optional[List[str]] = None,
-    offset: int = 0,
-    limit: int = 100,
-) -> Dict:
-    try:
-        request = PaperAuthorsRequest(
-            paper_id=paper_id,
-            fields=fields,
-            offset=offset,
-            limit=limit,
+def _paper_error(exc: S2Error, paper_id: str) -> Dict:
+    if isinstance(exc, S2ApiError) and exc.status_code == 404:
+        return create_error_response(
+            ErrorType.VALIDATION,
+            "Paper not found",
+            {"paper_id": paper_id},
         )
-        return await _client().get_paper_authors(request)
-    except S2ValidationError as exc:
-        return s2_exception_to_error_response(exc)
-    except S2ApiError as exc:
-        if "404" in exc.message:
-            return create_error_response(
-                ErrorType.VALIDATION,
-                "Paper not found",
-                {"paper_id": paper_id},
-            )
-        return s2_exception_to_error_response(exc)
-    except S2Error as exc:
-        return s2_exception_to_error_response(exc)
+    return s2_exception_to_error_response(exc)
 
 
-@mcp.tool()
-async def paper_citations(
-    context: Context,
-    paper_id: str,
-    fields: Optional[List[str]] = None,
-    offset: int = 0,
-    limit: int = 100,
-) -> Dict:
-    try:
-        request = PaperCitationsRequest(
-            paper_id=paper_id,
-            fields=fields,
-            offset=offset,
-            limit=limit,
-        )
-        return await _client().get_paper_citations(request)
-    except S2ValidationError as exc:
-        return s2_exception_to_error_response(exc)
-    except S2ApiError as exc:
-        if "404" in exc.message:
-            return create_error_response(
-                ErrorType.VALIDATION,
-                "Paper not found",
-                {"paper_id": paper_id},
+def _paper_page_tool(name: str, request_cls, fetch):
+    """Register a paginated /paper/{id}/<subresource> tool."""
+
+    async def tool(
+        context: Context,
+        paper_id: str,
+        fields: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> Dict:
+        try:
+            request = request_cls(
+                paper_id=paper_id,
+                fields=fields,
+                offset=offset,
+                limit=limit,
             )
-        return s2_exception_to_error_response(exc)
-    except S2Error as exc:
-        return s2_exception_to_error_response(exc)
+            return await fetch(_client(), request)
+        except S2Error as exc:
+            return _paper_error(exc, paper_id)
 
+    tool.__name__ = tool.__qualname__ = name
+    return mcp.tool(name=name)(tool)
 
-@mcp.tool()
-async def paper_references(
-    context: Context,
-    paper_id: str,
-    fields: Optional[List[str]] = None,
-    offset: int = 0,
-    limit: int = 100,
-) -> Dict:
-    try:
-        request = PaperReferencesRequest(
-            paper_id=paper_id,
-            fields=fields,
-            offset=offset,
-            limit=limit,
-        )
-        return await _client().get_paper_references(request)
-    except S2ValidationError as exc:
-        return s2_exception_to_error_response(exc)
-    except S2ApiError as exc:
-        if "404" in exc.message:
-            return create_error_response(
-                ErrorType.VALIDATION,
-                "Paper not found",
-                {"paper_id": paper_id},
+
+def _paper_all_pages_tool(name: str, request_cls, fetch_all):
+    """Register a tool that fetches several pages of a /paper/{id}/<subresource>."""
+
+    async def tool(
+        context: Context,
+        paper_id: str,
+        fields: Optional[List[str]] = None,
+        limit: int = 1000,
+        max_pages: int = 10,
+    ) -> Dict:
+        try:
+            request = request_cls(
+                paper_id=paper_id,
+                fields=fields,
+                limit=limit,
             )
-        return s2_exception_to_error_response(exc)
-    except S2Error as exc:
-        return s2_exception_to_error_response(exc)
+            return await fetch_all(_client(), request, max_pages=max_pages)
+        except S2Error as exc:
+            return _paper_error(exc, paper_id)
+
+    tool.__name__ = tool.__qualname__ = name
+    return mcp.tool(name=name)(tool)
+
+
+paper_authors = _paper_page_tool("paper_authors", PaperAuthorsRequest, S2Client.get_paper_authors)
+paper_citations = _paper_page_tool("paper_citations", PaperCitationsRequest, S2Client.get_paper_citations)
+paper_references = _paper_page_tool("paper_references", PaperReferencesRequest, S2Client.get_paper_references)
+paper_citations_all = _paper_all_pages_tool(
+    "paper_citations_all", PaperCitationsRequest, S2Client.get_paper_citations_all
+)
+paper_references_all = _paper_all_pages_tool(
+    "paper_references_all", PaperReferencesRequest, S2Client.get_paper_references_all
+)
 
 
 @mcp.tool()
@@ -4,15 +4,16 @@ HTTP Bridge for the Semantic Scholar MCP Server.
 
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
 
-from .config import AuthorDetailFields, Config, PaperFields
-from .core.client import S2Client, make_compat_client
-from .core.exceptions import S2Error
+from .config import AuthorDetailFields, Config
+from .core.client import S2Client, gather_bounded, make_compat_client
+from .core.exceptions import S2Error, S2ValidationError
 from .core.requests import (
     AuthorBatchDetailsRequest,
     AuthorDetailsRequest,
@@ -21,13 +22,21 @@ from .core.requests import (
     PaperDetailsRequest,
     PaperRelevanceSearchRequest,
     RequestModel,
+    is_valid_paper_id,
 )
 from .utils.errors import s2_exception_to_error_response
 from .utils.http import cleanup_client, initialize_client, make_request
 
 
-class IdList(BaseModel):
-    ids: List[str]
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    FastAPI's own ORJSONResponse is deprecated in newer releases, so the bridge
+    keeps this small equivalent.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
 
 @dataclass(slots=True)
@@ -40,6 +49,14 @@ class _BridgeRecommendationsRequest(RequestModel):
     def endpoint(self) -> str:
         return f"/papers/forpaper/{self.paper_id}"
 
+    def __post_init__(self) -> None:
+        if not is_valid_paper_id(self.paper_id):
+            raise S2ValidationError(
+                message="Invalid paper ID format",
+                details={"paper_id": self.paper_id},
+                field="paper_id",
+            )
+
     def to_params(self) -> dict[str, str]:
         params = {}
         if self.fields:
@@ -47,6 +64,36 @@ class _BridgeRecommendationsRequest(RequestModel):
         return params
 
 
+@dataclass(slots=True)
+class _BridgeRecommendationsBatchRequest:
+    """Seed papers for ``POST /v1/recommendations/batch``, one upstream request each."""
+
+    paper_ids: List[Any]
+    fields: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.paper_ids:
+            raise S2ValidationError(message="Paper IDs list cannot be empty", field="paper_ids")
+        if len(self.paper_ids) > Config.MAX_RECOMMENDATION_SEEDS:
+            raise S2ValidationError(
+                message=f"Cannot request recommendations for more than {Config.MAX_RECOMMENDATION_SEEDS} papers at once",
+                details={"max_papers": Config.MAX_RECOMMENDATION_SEEDS, "received": len(self.paper_ids)},
+                field="paper_ids",
+            )
+        if any(type(paper_id) is not str or not paper_id.strip() for paper_id in self.paper_ids):
+            raise S2ValidationError(message="Paper IDs must be non-empty strings", field="paper_ids")
+        invalid = [index for index, paper_id in enumerate(self.paper_ids) if not is_valid_paper_id(paper_id)]
+        if invalid:
+            raise S2ValidationError(
+                message="Invalid paper ID format",
+                details={"invalid_indices": invalid},
+                field="paper_ids",
+            )
+
+    def requests(self) -> List[_BridgeRecommendationsRequest]:
+        return [_BridgeRecommendationsRequest(paper_id=paper_id, fields=self.fields) for paper_id in self.paper_ids]
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await initialize_client()
@@ -56,33 +103,63 @@ async def lifespan(app: FastAPI):
         await cleanup_client()
 
 
-app = FastAPI(title="Semantic Scholar Bridge", version="0.1", lifespan=lifespan)
+app = FastAPI(
+    title="Semantic Scholar Bridge",
+    version="0.1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+# Batch and recommendation payloads are large, repetitive JSON; level 1 keeps
+# most of the size win for very little CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
 
 def _client() -> S2Client:
     return make_compat_client(make_request)
 
 
-def _bearer_token(request: Request) -> Optional[str]:
-    auth = request.headers.get("authorization")
-    if auth and auth.lower().startswith("bearer "):
-        return auth.split(None, 1)[1]
+async def get_bearer_token(request: Request) -> Optional[str]:
+    """Return the bearer token from the Authorization header, if any.
+
+    Reads the raw ASGI header list directly instead of building a Headers
+    mapping for a single lookup.
+    """
+    for name, value in request.scope["headers"]:
+        if name == b"authorization":
+            if value[:7].lower() == b"bearer ":
+                return value[7:].decode("latin-1").strip() or None
+            return None
     return None
 
 
-def _bridge_error_response(exc: S2Error) -> JSONResponse:
-    return JSONResponse(s2_exception_to_error_response(exc), status_code=200)
+async def get_id_list(request: Request) -> List[str]:
+    """Parse a ``{"ids": [...]}`` body with orjson.
+
+    IDs are forwarded as-is and checked by the request models, so the list is
+    not run through per-item pydantic validation.
+    """
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        payload = None
+    ids = payload.get("ids") if isinstance(payload, dict) else None
+    if not isinstance(ids, list):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object with an 'ids' list")
+    return ids
+
+
+def _bridge_error_response(exc: S2Error) -> ORJSONResponse:
+    return ORJSONResponse(s2_exception_to_error_response(exc), status_code=200)
 
 
-@app.get("/v1/paper/search")
+@app.get("/v1/paper/search", response_model=None)
 async def paper_search(
-    request: Request,
     q: str,
     fields: Optional[str] = None,
     offset: int = 0,
     limit: int = 10,
+    token: Optional[str] = Depends(get_bearer_token),
 ):
-    token = _bearer_token(request)
     try:
         request_model = PaperRelevanceSearchRequest(
             query=q,
@@ -90,46 +167,51 @@ async def paper_search(
             offset=offset,
             limit=limit,
         )
-        return await _client().search_papers(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().search_papers(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
 
 
-@app.get("/v1/paper/{paper_id}")
-async def paper_details(request: Request, paper_id: str, fields: Optional[str] = None):
-    token = _bearer_token(request)
+@app.get("/v1/paper/{paper_id}", response_model=None)
+async def paper_details(
+    paper_id: str,
+    fields: Optional[str] = None,
+    token: Optional[str] = Depends(get_bearer_token),
+):
     try:
         request_model = PaperDetailsRequest(
             paper_id=paper_id,
             fields=fields.split(",") if fields else Config.DEFAULT_FIELDS,
         )
-        return await _client().get_paper(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().get_paper(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
 
 
-@app.post("/v1/paper/batch")
-async def paper_batch(request: Request, batch: IdList, fields: Optional[str] = None):
-    token = _bearer_token(request)
+@app.post("/v1/paper/batch", response_model=None)
+async def paper_batch(
+    ids: List[str] = Depends(get_id_list),
+    fields: Optional[str] = None,
+    token: Optional[str] = Depends(get_bearer_token),
+):
     try:
         request_model = PaperBatchDetailsRequest(
-            paper_ids=batch.ids,
-            fields=fields if fields else ",".join(Config.DEFAULT_FIELDS),
+            paper_ids=ids,
+            fields=fields if fields else Config.DEFAULT_FIELDS_CSV,
         )
-        return await _client().batch_papers(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().batch_papers(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
 
 
-@app.get("/v1/author/search")
+@app.get("/v1/author/search", response_model=None)
 async def author_search(
-    request: Request,
     q: str,
     fields: Optional[str] = None,
     offset: int = 0,
     limit: int = 10,
+    token: Optional[str] = Depends(get_bearer_token),
 ):
-    token = _bearer_token(request)
     try:
         request_model = AuthorSearchRequest(
             query=q,
@@ -137,48 +219,88 @@ async def author_search(
             offset=offset,
             limit=limit,
         )
-        return await _client().search_authors(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().search_authors(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
 
 
-@app.get("/v1/author/{author_id}")
-async def author_details(request: Request, author_id: str, fields: Optional[str] = None):
-    token = _bearer_token(request)
+@app.get("/v1/author/{author_id}", response_model=None)
+async def author_details(
+    author_id: str,
+    fields: Optional[str] = None,
+    token: Optional[str] = Depends(get_bearer_token),
+):
     try:
         request_model = AuthorDetailsRequest(
             author_id=author_id,
             fields=fields.split(",") if fields else AuthorDetailFields.BASIC,
         )
-        return await _client().get_author(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().get_author(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
 
 
-@app.post("/v1/author/batch")
-async def author_batch(request: Request, batch: IdList, fields: Optional[str] = None):
-    token = _bearer_token(request)
+@app.post("/v1/author/batch", response_model=None)
+async def author_batch(
+    ids: List[str] = Depends(get_id_list),
+    fields: Optional[str] = None,
+    token: Optional[str] = Depends(get_bearer_token),
+):
     try:
         request_model = AuthorBatchDetailsRequest(
-            author_ids=batch.ids,
-            fields=fields if fields else ",".join(AuthorDetailFields.BASIC),
+            author_ids=ids,
+            fields=fields if fields else AuthorDetailFields.BASIC_CSV,
         )
-        return await _client().batch_authors(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().batch_authors(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
 
 
-@app.get("/v1/recommendations")
-async def recommendations(request: Request, paper_id: Optional[str] = None, fields: Optional[str] = None):
+@app.get("/v1/recommendations", response_model=None)
+async def recommendations(
+    paper_id: Optional[str] = None,
+    fields: Optional[str] = None,
+    token: Optional[str] = Depends(get_bearer_token),
+):
     if not paper_id:
         raise HTTPException(status_code=400, detail="paper_id is required")
 
-    token = _bearer_token(request)
     try:
         request_model = _BridgeRecommendationsRequest(
             paper_id=paper_id,
-            fields=fields if fields else ",".join(PaperFields.DEFAULT),
+            fields=fields if fields else Config.DEFAULT_FIELDS_CSV,
         )
-        return await _client().recommend_for_paper(request_model, api_key_override=token)
+        return ORJSONResponse(await _client().recommend_for_paper(request_model, api_key_override=token))
     except S2Error as exc:
         return _bridge_error_response(exc)
+
+
+@app.post("/v1/recommendations/batch", response_model=None)
+async def recommendations_batch(
+    ids: List[str] = Depends(get_id_list),
+    fields: Optional[str] = None,
+    token: Optional[str] = Depends(get_bearer_token),
+):
+    try:
+        request_model = _BridgeRecommendationsBatchRequest(
+            paper_ids=ids,
+            fields=fields if fields else Config.DEFAULT_FIELDS_CSV,
+        )
+    except S2Error as exc:
+        return _bridge_error_response(exc)
+
+    client = _client()
+
+    async def recommend(request: _BridgeRecommendationsRequest) -> Any:
+        # One failing seed (e.g. an unknown paper) reports its own error in
+        # its slot instead of failing the other seeds.
+        try:
+            return await client.recommend_for_paper(request, api_key_override=token)
+        except S2Error as exc:
+            return s2_exception_to_error_response(exc)
+
+    results = await gather_bounded(
+        (recommend(request) for request in request_model.requests()),
+        limit=Config.MAX_CONCURRENCY,
+    )
+    return ORJSONResponse(results)
@@ -2,13 +2,17 @@
 Configuration for the Semantic Scholar API Server.
 """
 
-from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Tuple, Any
 import os
 
+
+def env_flag(name: str, default: str) -> bool:
+    """Read a boolean environment variable ("1", "true", "yes" or "on" enable it)."""
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
 # Rate Limiting Configuration
-@dataclass
 class RateLimitConfig:
     # Define rate limits (requests, seconds)
     SEARCH_LIMIT = (1, 1)  # 1 request per 1 second
@@ -16,17 +20,6 @@ class RateLimitConfig:
     RECOMMENDATIONS_LIMIT = (1, 1)  # 1 request per 1 second
     DEFAULT_LIMIT = (10, 1)  # 10 requests per 1 second
     UNAUTHENTICATED_LIMIT = (100, 300)  # 100 requests per 5 minutes
-    
-    # Endpoints categorization
-    # These endpoints have stricter rate limits due to their computational intensity
-    # and to prevent abuse of the recommendation system
-    RESTRICTED_ENDPOINTS = [
-        "/author/batch",    # Batch operations are expensive
-        "/author/search",   # Search operations are computationally intensive
-        "/paper/batch",     # Batch operations are expensive
-        "/paper/search",    # Search operations are computationally intensive
-        "/recommendations"  # Recommendation generation is resource-intensive
-    ]
 
 # Error Types
 class ErrorType(Enum):
@@ -36,7 +29,7 @@ class ErrorType(Enum):
     TIMEOUT = "timeout"
 
 
-VALID_PUBLICATION_TYPES = {
+VALID_PUBLICATION_TYPES = frozenset({
     "Review",
     "JournalArticle",
     "CaseReport",
@@ -50,9 +43,9 @@ VALID_PUBLICATION_TYPES = {
     "Study",
     "Book",
     "BookSection",
-}
+})
 
-VALID_FIELDS_OF_STUDY = {
+VALID_FIELDS_OF_STUDY = frozenset({
     "Computer Science",
     "Medicine",
     "Chemistry",
@@ -76,19 +69,20 @@ VALID_FIELDS_OF_STUDY = {
     "Education",
     "Law",
     "Linguistics",
-}
+})
 
-VALID_RECOMMENDATION_POOLS = ["recent", "all-cs"]
+VALID_RECOMMENDATION_POOLS = ("recent", "all-cs")
 
 # Field Constants
 class PaperFields:
-    DEFAULT = ["title", "abstract", "year", "citationCount", "authors", "url"]
-    DETAILED = DEFAULT + ["references", "citations", "venue", "influentialCitationCount"]
-    MINIMAL = ["title", "year", "authors"]
-    SEARCH = ["paperId", "title", "year", "citationCount"]
+    DEFAULT = ("title", "abstract", "year", "citationCount", "authors", "url")
+    DEFAULT_CSV = ",".join(DEFAULT)
+    DETAILED = DEFAULT + ("references", "citations", "venue", "influentialCitationCount")
+    MINIMAL = ("title", "year", "authors")
+    SEARCH = ("paperId", "title", "year", "citationCount")
     
     # Valid fields from API documentation
-    VALID_FIELDS = {
+    VALID_FIELDS = frozenset({
         "abstract",
         "authors",
         "citationCount",
@@ -115,32 +109,33 @@ class PaperFields:
         "url",
         "venue",
         "year"
-    }
+    })
 
 class AuthorDetailFields:
     """Common field combinations for author details"""
     
     # Basic author information
-    BASIC = ["name", "url", "affiliations"]
+    BASIC = ("name", "url", "affiliations")
+    BASIC_CSV = ",".join(BASIC)
     
     # Author's papers information
-    PAPERS_BASIC = ["papers"]  # Returns paperId and title
-    PAPERS_DETAILED = [
+    PAPERS_BASIC = ("papers",)  # Returns paperId and title
+    PAPERS_DETAILED = (
         "papers.year",
         "papers.authors",
         "papers.abstract",
         "papers.venue",
         "papers.url"
-    ]
+    )
     
     # Complete author profile
-    COMPLETE = BASIC + ["papers", "papers.year", "papers.authors", "papers.venue"]
+    COMPLETE = BASIC + ("papers", "papers.year", "papers.authors", "papers.venue")
     
     # Citation metrics
-    METRICS = ["citationCount", "hIndex", "paperCount"]
+    METRICS = ("citationCount", "hIndex", "paperCount")
 
     # Valid fields for author details
-    VALID_FIELDS = {
+    VALID_FIELDS = frozenset({
         "affiliations",
         "authorId",
         "citationCount",
@@ -172,44 +167,44 @@ class AuthorDetailFields:
         "papers.venue",
         "papers.year",
         "url",
-    }
+    })
 
 class PaperDetailFields:
     """Common field combinations for paper details"""
     
     # Basic paper information
-    BASIC = ["title", "abstract", "year", "venue"]
+    BASIC = ("title", "abstract", "year", "venue")
     
     # Author information
-    AUTHOR_BASIC = ["authors"]
-    AUTHOR_DETAILED = ["authors.url", "authors.paperCount", "authors.citationCount"]
+    AUTHOR_BASIC = ("authors",)
+    AUTHOR_DETAILED = ("authors.url", "authors.paperCount", "authors.citationCount")
     
     # Citation information
-    CITATION_BASIC = ["citations", "references"]
-    CITATION_DETAILED = ["citations.title", "citations.abstract", "citations.year",
-                        "references.title", "references.abstract", "references.year"]
+    CITATION_BASIC = ("citations", "references")
+    CITATION_DETAILED = ("citations.title", "citations.abstract", "citations.year",
+                         "references.title", "references.abstract", "references.year")
     
     # Full paper details
-    COMPLETE = BASIC + AUTHOR_BASIC + CITATION_BASIC + ["url", "fieldsOfStudy", 
-                                                       "publicationVenue", "publicationTypes"]
+    COMPLETE = BASIC + AUTHOR_BASIC + CITATION_BASIC + ("url", "fieldsOfStudy", 
+                                                       "publicationVenue", "publicationTypes")
 
 class CitationReferenceFields:
     """Common field combinations for citation and reference queries"""
     
     # Basic information
-    BASIC = ["title"]
+    BASIC = ("title",)
     
     # Citation/Reference context
-    CONTEXT = ["contexts", "intents", "isInfluential"]
+    CONTEXT = ("contexts", "intents", "isInfluential")
     
     # Paper details
-    DETAILED = ["title", "abstract", "authors", "year", "venue"]
+    DETAILED = ("title", "abstract", "authors", "year", "venue")
     
     # Full information
     COMPLETE = CONTEXT + DETAILED
 
     # Valid fields for citation/reference queries
-    VALID_FIELDS = {
+    VALID_FIELDS = frozenset({
         "abstract",
         "authors",
         "citationCount",
@@ -235,7 +230,7 @@ class CitationReferenceFields:
         "url",
         "venue",
         "year",
-    }
+    })
 
 # Configuration
 class Config:
@@ -244,18 +239,47 @@ class Config:
     BASE_URL = f"https://api.semanticscholar.org/graph/{API_VERSION}"
     RECOMMENDATIONS_BASE_URL = "https://api.semanticscholar.org/recommendations/v1"
     TIMEOUT = int(os.getenv("SEMANTIC_SCHOLAR_TIMEOUT", "30"))  # seconds
+    CONNECT_TIMEOUT = min(5.0, TIMEOUT)  # seconds; fail fast on unreachable hosts
+
+    # Shared HTTP client connection pool
+    HTTP2 = env_flag("SEMANTIC_SCHOLAR_HTTP2", "1")
+    HTTP_MAX_CONNECTIONS = 50
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+    HTTP_KEEPALIVE_EXPIRY = 60.0  # seconds
     
     # Request Limits
     MAX_BATCH_SIZE = 100
     MAX_RESULTS_PER_PAGE = 100
     DEFAULT_PAGE_SIZE = 10
     MAX_BATCHES = 5
+    MAX_CONCURRENCY = 8  # upstream requests in flight per fan-out
+    AUTHOR_BATCH_CHUNK_SIZE = 1000  # IDs per upstream POST /author/batch (API maximum)
+    PAPER_BATCH_CHUNK_SIZE = 500  # IDs per upstream POST /paper/batch (API maximum)
+    MAX_BATCH_IDS = 10000  # IDs accepted per batch tool call
+    MAX_RECOMMENDATION_SEEDS = 100  # seed papers per bridge recommendations batch
+
+    # Concurrent author_details calls arriving within this window are merged
+    # into a single POST /author/batch. 0 (the default) disables it.
+    AUTHOR_COALESCE_WINDOW = float(os.getenv("SEMANTIC_SCHOLAR_AUTHOR_COALESCE_MS", "0")) / 1000
     
     # Fields Configuration
     DEFAULT_FIELDS = PaperFields.DEFAULT
+    DEFAULT_FIELDS_CSV = PaperFields.DEFAULT_CSV
     
     # Feature Flags
-    ENABLE_CACHING = False
+    ENABLE_CACHING = env_flag("SEMANTIC_SCHOLAR_ENABLE_CACHING", "0")
+    CACHE_TTL = float(os.getenv("SEMANTIC_SCHOLAR_CACHE_TTL", "300"))  # seconds
+    CACHE_SIZE = int(os.getenv("SEMANTIC_SCHOLAR_CACHE_SIZE", "1024"))  # responses
+    # Optional persistent tier (requires diskcache); unset keeps the cache in memory
+    CACHE_DIR = os.getenv("SEMANTIC_SCHOLAR_CACHE_DIR", "").strip() or None
+    CACHE_DISK_TTL = float(os.getenv("SEMANTIC_SCHOLAR_CACHE_DISK_TTL", "86400"))  # seconds
+    # Share one upstream call between identical concurrent requests
+    DEDUPE_INFLIGHT = env_flag("SEMANTIC_SCHOLAR_DEDUPE_INFLIGHT", "1")
+    # Replay upstream 400s for this long (and 429s until Retry-After, at most
+    # this long) instead of re-sending the same request; 0 disables
+    ERROR_CACHE_TTL = float(os.getenv("SEMANTIC_SCHOLAR_ERROR_CACHE_TTL", "0"))  # seconds
+    # Send a backup copy of a GET still pending after this long; 0 disables
+    HEDGE_AFTER = float(os.getenv("SEMANTIC_SCHOLAR_HEDGE_AFTER_MS", "0")) / 1000  # seconds
     DEBUG_MODE = False
     
     # Search Configuration
@@ -1,6 +1,14 @@
 """Shared core transport primitives for Semantic Scholar clients."""
 
-from .client import S2Client, SupportsRequestJson, get_default_client, make_compat_client
+from .cache import TieredCache, TTLCache
+from .client import (
+    S2Client,
+    SupportsRequestJson,
+    gather_bounded,
+    get_default_client,
+    make_compat_client,
+)
+from .coalesce import AuthorDetailsCoalescer
 from .exceptions import (
     S2ApiError,
     S2Error,
@@ -38,9 +46,11 @@ from .transport import (
     get_api_key,
     initialize_client,
     rate_limiter,
+    response_cache,
 )
 
 __all__ = [
+    "AuthorDetailsCoalescer",
     "AuthorBatchDetailsRequest",
     "AuthorDetailsRequest",
     "AuthorPapersRequest",
@@ -69,12 +79,16 @@ __all__ = [
     "S2ValidationError",
     "SnippetSearchRequest",
     "SupportsRequestJson",
+    "TTLCache",
+    "TieredCache",
     "cleanup_client",
     "default_transport",
     "error_dict_to_exception",
+    "gather_bounded",
     "get_default_client",
     "get_api_key",
     "initialize_client",
     "make_compat_client",
     "rate_limiter",
+    "response_cache",
 ]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire ``ttl`` seconds after they are stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl: float,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock or time.monotonic
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (self._clock() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_MISSING = object()
+
+
+class TieredCache:
+    """
+    In-memory ``TTLCache`` in front of a persistent ``diskcache.Cache``.
+
+    Memory hits are answered inline; disk reads and writes run in a worker
+    thread so sqlite I/O stays off the event loop. Disk entries outlive the
+    process and are promoted into memory on a hit, for no longer than they
+    have left on disk.
+    """
+
+    def __init__(self, memory: TTLCache, disk: Any, *, disk_ttl: float):
+        self.memory = memory
+        self.disk = disk
+        self.disk_ttl = disk_ttl
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value, expires_at = await asyncio.to_thread(self.disk.get, key, default=_MISSING, expire_time=True)
+        if value is _MISSING:
+            return default
+        ttl = self.memory.ttl
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            self.memory.set(key, value, ttl=ttl)
+        return value
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self.memory.set(key, value, ttl=ttl)
+        await asyncio.to_thread(self.disk.set, key, value, expire=self.disk_ttl if ttl is None else ttl)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.disk.clear()
+
+    def close(self) -> None:
+        self.disk.close()
+
+    def __len__(self) -> int:
+        return len(self.memory)
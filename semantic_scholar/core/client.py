@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol
+import asyncio
+import dataclasses
+from typing import Any, Awaitable, Callable, Iterable, Optional, Protocol, TypeVar
 
+from ..config import Config
+from .exceptions import S2Error, S2ValidationError
 from .requests import (
     AuthorBatchDetailsRequest,
     AuthorDetailsRequest,
@@ -23,6 +27,48 @@ from .requests import (
 )
 from .transport import MakeRequestCompatTransport, default_transport
 
+T = TypeVar("T")
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]], *, limit: int) -> list[T]:
+    """
+    Await all of ``aws`` concurrently, with at most ``limit`` in flight at once.
+
+    If one fails, the rest are cancelled. Those not yet started never reserve
+    a rate-limiter slot; those still waiting for theirs hand it back when it
+    is the newest reservation in its bucket.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                return await aw
+        finally:
+            # Cancelled while waiting for a slot: close the never-started
+            # coroutine so it is not reported as "never awaited".
+            if asyncio.iscoroutine(aw):
+                aw.close()
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Newest first, so each cancelled waiter's slot is the newest one in
+        # its bucket when it is released.
+        for task in reversed(tasks):
+            task.cancel()
+        raise
+
+
+def _validate_max_pages(max_pages: int) -> None:
+    if max_pages < 1:
+        raise S2ValidationError(
+            message="max_pages must be at least 1",
+            details={"min_max_pages": 1},
+            field="max_pages",
+        )
+
 
 class SupportsRequestJson(Protocol):
     async def request_json(
@@ -56,6 +102,79 @@ class S2Client:
             base_url=request.base_url,
         )
 
+    async def _request_chunked(
+        self,
+        request: Any,
+        ids_field: str,
+        size: int,
+        *,
+        api_key_override: Optional[str] = None,
+    ) -> list[Any]:
+        """
+        Send a batch request in chunks of ``size`` IDs and merge the results in order.
+
+        A chunk that fails contributes ``None`` for each of its IDs, so the result
+        stays index-aligned with the input; only if every chunk fails is the
+        first error raised.
+        """
+        ids = getattr(request, ids_field)
+        if len(ids) <= size:
+            return await self._request(request, api_key_override=api_key_override)
+
+        errors: list[S2Error] = []
+
+        async def fetch(chunk: list[str]) -> list[Any]:
+            try:
+                return await self._request(
+                    dataclasses.replace(request, **{ids_field: chunk}),
+                    api_key_override=api_key_override,
+                )
+            except S2Error as exc:
+                errors.append(exc)
+                return [None] * len(chunk)
+
+        chunks = await gather_bounded(
+            (fetch(ids[start : start + size]) for start in range(0, len(ids), size)),
+            limit=Config.MAX_CONCURRENCY,
+        )
+        if len(errors) == len(chunks):
+            raise errors[0]
+        return [item for chunk in chunks for item in chunk]
+
+    async def _collect_pages(
+        self,
+        request: Any,
+        first_page: dict[str, Any],
+        total: int,
+        fetch_page: Callable[..., Awaitable[dict[str, Any]]],
+        *,
+        max_pages: int,
+        concurrency: int,
+        api_key_override: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Fetch the pages after ``first_page`` concurrently and merge their data in order."""
+        end = min(total, request.offset + max_pages * request.limit)
+        offsets = []
+        if first_page.get("next") is not None:
+            offsets = list(range(request.offset + request.limit, end, request.limit))
+
+        pages = await gather_bounded(
+            (
+                fetch_page(dataclasses.replace(request, offset=offset), api_key_override=api_key_override)
+                for offset in offsets
+            ),
+            limit=concurrency,
+        )
+
+        data = list(first_page.get("data") or [])
+        for page in pages:
+            data.extend(page.get("data") or [])
+
+        result: dict[str, Any] = {"offset": request.offset, "total": total, "data": data}
+        if end < total:
+            result["next"] = end
+        return result
+
     async def search_papers(
         self,
         request: PaperRelevanceSearchRequest,
@@ -94,7 +213,12 @@ class S2Client:
         *,
         api_key_override: Optional[str] = None,
     ) -> list[dict[str, Any] | None]:
-        return await self._request(request, api_key_override=api_key_override)
+        return await self._request_chunked(
+            request,
+            "paper_ids",
+            Config.PAPER_BATCH_CHUNK_SIZE,
+            api_key_override=api_key_override,
+        )
 
     async def get_paper_authors(
         self,
@@ -120,6 +244,70 @@ class S2Client:
     ) -> dict[str, Any]:
         return await self._request(request, api_key_override=api_key_override)
 
+    async def _get_paper_pages_all(
+        self,
+        request: PaperCitationsRequest | PaperReferencesRequest,
+        count_field: str,
+        fetch_page: Callable[..., Awaitable[dict[str, Any]]],
+        *,
+        max_pages: int,
+        concurrency: int,
+        api_key_override: Optional[str] = None,
+    ) -> dict[str, Any]:
+        _validate_max_pages(max_pages)
+        # Citation and reference pages carry no total; the paper's own
+        # citationCount/referenceCount tells how far to fan out.
+        first_page, paper = await asyncio.gather(
+            fetch_page(request, api_key_override=api_key_override),
+            self.get_paper(
+                PaperDetailsRequest(paper_id=request.paper_id, fields=[count_field]),
+                api_key_override=api_key_override,
+            ),
+        )
+        return await self._collect_pages(
+            request,
+            first_page,
+            int(paper.get(count_field) or 0),
+            fetch_page,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            api_key_override=api_key_override,
+        )
+
+    async def get_paper_citations_all(
+        self,
+        request: PaperCitationsRequest,
+        *,
+        max_pages: int = 10,
+        concurrency: int = Config.MAX_CONCURRENCY,
+        api_key_override: Optional[str] = None,
+    ) -> dict[str, Any]:
+        return await self._get_paper_pages_all(
+            request,
+            "citationCount",
+            self.get_paper_citations,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            api_key_override=api_key_override,
+        )
+
+    async def get_paper_references_all(
+        self,
+        request: PaperReferencesRequest,
+        *,
+        max_pages: int = 10,
+        concurrency: int = Config.MAX_CONCURRENCY,
+        api_key_override: Optional[str] = None,
+    ) -> dict[str, Any]:
+        return await self._get_paper_pages_all(
+            request,
+            "referenceCount",
+            self.get_paper_references,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            api_key_override=api_key_override,
+        )
+
     async def autocomplete_papers(
         self,
         request: PaperAutocompleteRequest,
@@ -160,13 +348,46 @@ class S2Client:
     ) -> dict[str, Any]:
         return await self._request(request, api_key_override=api_key_override)
 
+    async def get_author_papers_all(
+        self,
+        request: AuthorPapersRequest,
+        *,
+        max_pages: int = 10,
+        concurrency: int = Config.MAX_CONCURRENCY,
+        api_key_override: Optional[str] = None,
+    ) -> dict[str, Any]:
+        _validate_max_pages(max_pages)
+        # The papers endpoint does not report a total, so ask for the author's
+        # paperCount alongside the first page to know how many pages to fan out.
+        first_page, author = await asyncio.gather(
+            self.get_author_papers(request, api_key_override=api_key_override),
+            self.get_author(
+                AuthorDetailsRequest(author_id=request.author_id, fields=["paperCount"]),
+                api_key_override=api_key_override,
+            ),
+        )
+        return await self._collect_pages(
+            request,
+            first_page,
+            int(author.get("paperCount") or 0),
+            self.get_author_papers,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            api_key_override=api_key_override,
+        )
+
     async def batch_authors(
         self,
         request: AuthorBatchDetailsRequest,
         *,
         api_key_override: Optional[str] = None,
     ) -> list[dict[str, Any] | None]:
-        return await self._request(request, api_key_override=api_key_override)
+        return await self._request_chunked(
+            request,
+            "author_ids",
+            Config.AUTHOR_BATCH_CHUNK_SIZE,
+            api_key_override=api_key_override,
+        )
 
     async def recommend_for_paper(
         self,
@@ -189,5 +410,15 @@ def get_default_client() -> S2Client:
     return S2Client(default_transport)
 
 
+_compat_client: Optional[tuple[Any, S2Client]] = None
+
+
 def make_compat_client(make_request_callable) -> S2Client:
-    return S2Client(MakeRequestCompatTransport(make_request_callable))
+    # Tools call this on every invocation; reuse the client while the callable
+    # is unchanged (tests swap it via monkeypatch, so compare by identity).
+    global _compat_client
+    cached = _compat_client
+    if cached is None or cached[0] is not make_request_callable:
+        cached = (make_request_callable, S2Client(MakeRequestCompatTransport(make_request_callable)))
+        _compat_client = cached
+    return cached[1]
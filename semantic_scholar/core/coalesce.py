@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from .client import S2Client
+from .exceptions import S2ApiError, S2NotFoundError, S2RateLimitError
+from .requests import AuthorBatchDetailsRequest, AuthorDetailsRequest
+
+
+@dataclass(eq=False)
+class _PendingBatch:
+    client: S2Client
+    waiters: list[tuple[AuthorDetailsRequest, asyncio.Future]] = field(default_factory=list)
+
+
+class AuthorDetailsCoalescer:
+    """
+    Merge concurrent single-author lookups into one POST /author/batch.
+
+    Lookups that arrive within ``window`` seconds of each other and ask for the
+    same fields share a single upstream request. A lone lookup still goes out
+    as a plain GET /author/{id}, so isolated calls only pay the window delay.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 0.005,
+        max_batch: int = 1000,
+        sleeper: Optional[Callable[[float], Awaitable[Any]]] = None,
+    ):
+        self._window = window
+        self._max_batch = max_batch
+        self._sleep = sleeper or asyncio.sleep
+        self._pending: dict[Optional[str], _PendingBatch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get_author(self, client: S2Client, request: AuthorDetailsRequest) -> dict[str, Any]:
+        if self._window <= 0:
+            return await client.get_author(request)
+
+        key = request.to_params().get("fields")
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(client=client)
+            self._pending[key] = batch
+            self._spawn(self._flush_later(key, batch))
+
+        future = asyncio.get_running_loop().create_future()
+        batch.waiters.append((request, future))
+        if len(batch.waiters) >= self._max_batch:
+            del self._pending[key]
+            self._spawn(self._dispatch(key, batch))
+        return await future
+
+    def _spawn(self, coro) -> None:
+        # Keep a strong reference so pending flushes are not garbage collected.
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_later(self, key: Optional[str], batch: _PendingBatch) -> None:
+        await self._sleep(self._window)
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+            await self._dispatch(key, batch)
+
+    async def _dispatch(self, key: Optional[str], batch: _PendingBatch) -> None:
+        waiters = batch.waiters
+        try:
+            if len(waiters) == 1:
+                await self._lookup_one(batch.client, *waiters[0])
+                return
+
+            author_ids = list(dict.fromkeys(request.author_id for request, _ in waiters))
+            try:
+                results = await batch.client.batch_authors(
+                    AuthorBatchDetailsRequest(author_ids=author_ids, fields=key)
+                )
+            except S2ApiError as exc:
+                # A client error (e.g. one caller's malformed ID) must not fail
+                # everyone else, so each lookup is retried on its own. Rate
+                # limits and server errors go to every waiter instead; fanning
+                # out would only add load while the API is struggling.
+                status_code = exc.status_code or 0
+                if isinstance(exc, S2RateLimitError) or not 400 <= status_code < 500:
+                    raise
+                await asyncio.gather(
+                    *(self._lookup_one(batch.client, request, future) for request, future in waiters)
+                )
+                return
+            by_id = dict(zip(author_ids, results))
+            for request, future in waiters:
+                if future.done():
+                    continue
+                author = by_id.get(request.author_id)
+                if author is None:
+                    future.set_exception(
+                        S2NotFoundError(
+                            message="HTTP error: 404",
+                            status_code=404,
+                            endpoint=request.endpoint,
+                            method=request.method,
+                            resource_type="author",
+                            resource_id=request.author_id,
+                        )
+                    )
+                else:
+                    future.set_result(author)
+        except Exception as exc:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+        except BaseException:
+            for _, future in waiters:
+                future.cancel()
+            raise
+
+    @staticmethod
+    async def _lookup_one(client: S2Client, request: AuthorDetailsRequest, future: asyncio.Future) -> None:
+        try:
+            result = await client.get_author(request)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(result)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import AbstractSet, Any, Optional
 
 from ..config import (
     AuthorDetailFields,
@@ -16,6 +18,9 @@ from .exceptions import S2ValidationError
 
 VALID_BULK_SORT_FIELDS = ["paperId", "publicationDate", "citationCount"]
 VALID_BULK_SORT_ORDERS = ["asc", "desc"]
+_VALID_BULK_SORTS = frozenset(
+    f"{field}:{order}" for field in VALID_BULK_SORT_FIELDS for order in VALID_BULK_SORT_ORDERS
+)
 
 
 class RequestModel:
@@ -33,31 +38,89 @@ class RequestModel:
         return None
 
 
+def _csv(values: list[str]) -> str:
+    # Filters are usually a single value; skip the join for those. Filter
+    # values are too varied to share _join_fields' cache with field lists.
+    return values[0] if len(values) == 1 else ",".join(values)
+
+
 def _raise_validation(message: str, details: Optional[dict[str, Any]] = None, field: Optional[str] = None) -> None:
     raise S2ValidationError(message=message, details=details or {}, field=field)
 
 
-def _validate_fields(fields: list[str], valid_fields: set[str]) -> None:
-    invalid_fields = set(fields) - valid_fields
-    if invalid_fields:
-        _raise_validation(
-            f"Invalid fields: {', '.join(invalid_fields)}",
-            {"valid_fields": list(valid_fields)},
-            field="fields",
-        )
+@lru_cache(maxsize=256)
+def _join_fields(fields: tuple[str, ...]) -> str:
+    # Callers tend to repeat the same field selections, so reuse the joined
+    # string instead of rebuilding it for every request.
+    return ",".join(fields)
+
+
+def _require_text(value: str, message: str, field: str) -> None:
+    if not value.strip():
+        _raise_validation(message, field=field)
+
+
+# A bare S2 paper ID / SHA, or one of the external ID prefixes the API accepts.
+# No ID may contain "?" or "#", so none can add a query string or fragment to
+# the upstream URL; bare IDs also exclude "/" (DOIs and URLs need it).
+_PAPER_ID_RE = re.compile(r"(?:(?:CorpusId|DOI|ARXIV|MAG|ACL|PMID|PMCID|URL):[^\s?#]+|[^\s:/?#]+)", re.IGNORECASE)
+
+
+def is_valid_paper_id(paper_id: Any) -> bool:
+    return type(paper_id) is str and _PAPER_ID_RE.fullmatch(paper_id) is not None
 
 
-def _validate_csv_fields(fields: str, valid_fields: set[str]) -> None:
-    field_list = fields.split(",")
-    invalid_fields = set(field_list) - valid_fields
-    if invalid_fields:
+def _validate_paper_id(paper_id: str) -> None:
+    if not is_valid_paper_id(paper_id):
+        _raise_validation("Invalid paper ID format", {"paper_id": paper_id}, field="paper_id")
+
+
+# Year filters the API accepts: "2019", "2016-2020", "2010-" or "-2015".
+_YEAR_RE = re.compile(r"\d{4}(?:-(?:\d{4})?)?|-\d{4}")
+
+
+def _validate_year(year: Optional[str]) -> None:
+    if year and not _YEAR_RE.fullmatch(year):
         _raise_validation(
-            f"Invalid fields: {', '.join(invalid_fields)}",
-            {"valid_fields": list(valid_fields)},
-            field="fields",
+            "Invalid year format. Use YYYY, YYYY-YYYY, YYYY- or -YYYY",
+            {"year": year},
+            field="year",
         )
 
 
+def _validate_max_limit(limit: int, max_limit: int = 1000) -> None:
+    if limit > max_limit:
+        _raise_validation(f"Limit cannot exceed {max_limit}", {"max_limit": max_limit}, field="limit")
+
+
+def _validate_min_limit(limit: int) -> None:
+    if limit < 1:
+        _raise_validation("Limit must be at least 1", {"min_limit": 1}, field="limit")
+
+
+def _validate_fields(fields: list[str], valid_fields: AbstractSet[str]) -> None:
+    if valid_fields.issuperset(fields):
+        return
+    invalid_fields = [f for f in fields if f not in valid_fields]
+    _raise_validation(
+        f"Invalid fields: {', '.join(invalid_fields)}",
+        {"valid_fields": list(valid_fields)},
+        field="fields",
+    )
+
+
+def _validate_csv_fields(fields: str, valid_fields: AbstractSet[str]) -> None:
+    requested = fields.split(",")
+    if valid_fields.issuperset(requested):
+        return
+    invalid_fields = [f for f in requested if f not in valid_fields]
+    _raise_validation(
+        f"Invalid fields: {', '.join(invalid_fields)}",
+        {"valid_fields": list(valid_fields)},
+        field="fields",
+    )
+
+
 @dataclass(slots=True)
 class PaperRelevanceSearchRequest(RequestModel):
     query: str
@@ -76,12 +139,12 @@ class PaperRelevanceSearchRequest(RequestModel):
         return "/paper/search"
 
     def __post_init__(self) -> None:
-        if not self.query.strip():
-            _raise_validation("Query string cannot be empty", field="query")
+        _require_text(self.query, "Query string cannot be empty", "query")
         if self.fields is None:
             self.fields = list(PaperFields.DEFAULT)
         else:
             _validate_fields(self.fields, PaperFields.VALID_FIELDS)
+        _validate_year(self.year)
         self.limit = min(self.limit, 100)
 
     def to_params(self) -> dict[str, Any]:
@@ -89,10 +152,10 @@ class PaperRelevanceSearchRequest(RequestModel):
             "query": self.query,
             "offset": self.offset,
             "limit": self.limit,
-            "fields": ",".join(self.fields or []),
+            "fields": _join_fields(tuple(self.fields or ())),
         }
         if self.publication_types:
-            params["publicationTypes"] = ",".join(self.publication_types)
+            params["publicationTypes"] = _csv(self.publication_types)
         if self.open_access_pdf:
             params["openAccessPdf"] = "true"
         if self.min_citation_count is not None:
@@ -100,9 +163,9 @@ class PaperRelevanceSearchRequest(RequestModel):
         if self.year:
             params["year"] = self.year
         if self.venue:
-            params["venue"] = ",".join(self.venue)
+            params["venue"] = _csv(self.venue)
         if self.fields_of_study:
-            params["fieldsOfStudy"] = ",".join(self.fields_of_study)
+            params["fieldsOfStudy"] = _csv(self.fields_of_study)
         return params
 
 
@@ -127,7 +190,9 @@ class PaperBulkSearchRequest(RequestModel):
     def __post_init__(self) -> None:
         if self.fields:
             _validate_fields(self.fields, PaperFields.VALID_FIELDS)
-        if self.sort:
+        _validate_year(self.year)
+        if self.sort and self.sort not in _VALID_BULK_SORTS:
+            # Only malformed values reach the parsing below, which picks the message.
             try:
                 field, order = self.sort.split(":")
             except ValueError as exc:
@@ -143,24 +208,22 @@ class PaperBulkSearchRequest(RequestModel):
                     "Invalid sort order. Must be one of: asc, desc",
                     field="sort",
                 )
-        if self.publication_types:
+        if self.publication_types and not VALID_PUBLICATION_TYPES.issuperset(self.publication_types):
             invalid_types = set(self.publication_types) - VALID_PUBLICATION_TYPES
-            if invalid_types:
-                _raise_validation(
-                    f"Invalid publication types: {', '.join(invalid_types)}",
-                    {"valid_types": list(VALID_PUBLICATION_TYPES)},
-                    field="publication_types",
-                )
+            _raise_validation(
+                f"Invalid publication types: {', '.join(invalid_types)}",
+                {"valid_types": list(VALID_PUBLICATION_TYPES)},
+                field="publication_types",
+            )
         if self.min_citation_count is not None and self.min_citation_count < 0:
             _raise_validation("Minimum citation count cannot be negative", field="min_citation_count")
-        if self.fields_of_study:
+        if self.fields_of_study and not VALID_FIELDS_OF_STUDY.issuperset(self.fields_of_study):
             invalid_fields = set(self.fields_of_study) - VALID_FIELDS_OF_STUDY
-            if invalid_fields:
-                _raise_validation(
-                    f"Invalid fields of study: {', '.join(invalid_fields)}",
-                    {"valid_fields": list(VALID_FIELDS_OF_STUDY)},
-                    field="fields_of_study",
-                )
+            _raise_validation(
+                f"Invalid fields of study: {', '.join(invalid_fields)}",
+                {"valid_fields": list(VALID_FIELDS_OF_STUDY)},
+                field="fields_of_study",
+            )
 
     def to_params(self) -> dict[str, Any]:
         params: dict[str, Any] = {}
@@ -169,11 +232,11 @@ class PaperBulkSearchRequest(RequestModel):
         if self.token:
             params["token"] = self.token
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         if self.sort:
             params["sort"] = self.sort
         if self.publication_types:
-            params["publicationTypes"] = ",".join(self.publication_types)
+            params["publicationTypes"] = _csv(self.publication_types)
         if self.open_access_pdf:
             params["openAccessPdf"] = "true"
         if self.min_citation_count is not None:
@@ -183,9 +246,9 @@ class PaperBulkSearchRequest(RequestModel):
         elif self.year:
             params["year"] = self.year
         if self.venue:
-            params["venue"] = ",".join(self.venue)
+            params["venue"] = _csv(self.venue)
         if self.fields_of_study:
-            params["fieldsOfStudy"] = ",".join(self.fields_of_study)
+            params["fieldsOfStudy"] = _csv(self.fields_of_study)
         return params
 
 
@@ -205,17 +268,17 @@ class PaperTitleSearchRequest(RequestModel):
         return "/paper/search/match"
 
     def __post_init__(self) -> None:
-        if not self.query.strip():
-            _raise_validation("Query string cannot be empty", field="query")
+        _require_text(self.query, "Query string cannot be empty", "query")
         if self.fields is None:
             self.fields = list(PaperFields.DEFAULT)
         else:
             _validate_fields(self.fields, PaperFields.VALID_FIELDS)
+        _validate_year(self.year)
 
     def to_params(self) -> dict[str, Any]:
-        params = {"query": self.query, "fields": ",".join(self.fields or [])}
+        params = {"query": self.query, "fields": _join_fields(tuple(self.fields or ()))}
         if self.publication_types:
-            params["publicationTypes"] = ",".join(self.publication_types)
+            params["publicationTypes"] = _csv(self.publication_types)
         if self.open_access_pdf:
             params["openAccessPdf"] = "true"
         if self.min_citation_count is not None:
@@ -223,9 +286,9 @@ class PaperTitleSearchRequest(RequestModel):
         if self.year:
             params["year"] = self.year
         if self.venue:
-            params["venue"] = ",".join(self.venue)
+            params["venue"] = _csv(self.venue)
         if self.fields_of_study:
-            params["fieldsOfStudy"] = ",".join(self.fields_of_study)
+            params["fieldsOfStudy"] = _csv(self.fields_of_study)
         return params
 
 
@@ -239,13 +302,13 @@ class PaperDetailsRequest(RequestModel):
         return f"/paper/{self.paper_id}"
 
     def __post_init__(self) -> None:
-        if not self.paper_id.strip():
-            _raise_validation("Paper ID cannot be empty", field="paper_id")
+        _require_text(self.paper_id, "Paper ID cannot be empty", "paper_id")
+        _validate_paper_id(self.paper_id)
 
     def to_params(self) -> dict[str, Any]:
         params = {}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -262,12 +325,19 @@ class PaperBatchDetailsRequest(RequestModel):
     def __post_init__(self) -> None:
         if not self.paper_ids:
             _raise_validation("Paper IDs list cannot be empty", field="paper_ids")
-        if len(self.paper_ids) > 500:
+        if len(self.paper_ids) > Config.MAX_BATCH_IDS:
             _raise_validation(
-                "Cannot process more than 500 paper IDs at once",
-                {"max_papers": 500, "received": len(self.paper_ids)},
+                f"Cannot process more than {Config.MAX_BATCH_IDS} paper IDs at once",
+                {"max_papers": Config.MAX_BATCH_IDS, "received": len(self.paper_ids)},
                 field="paper_ids",
             )
+        invalid = [
+            index
+            for index, paper_id in enumerate(self.paper_ids)
+            if not is_valid_paper_id(paper_id)
+        ]
+        if invalid:
+            _raise_validation("Invalid paper ID format", {"invalid_indices": invalid}, field="paper_ids")
         if self.fields:
             _validate_csv_fields(self.fields, PaperFields.VALID_FIELDS)
 
@@ -293,17 +363,17 @@ class PaperAuthorsRequest(RequestModel):
         return f"/paper/{self.paper_id}/authors"
 
     def __post_init__(self) -> None:
-        if not self.paper_id.strip():
-            _raise_validation("Paper ID cannot be empty", field="paper_id")
-        if self.limit > 1000:
-            _raise_validation("Limit cannot exceed 1000", {"max_limit": 1000}, field="limit")
+        _require_text(self.paper_id, "Paper ID cannot be empty", "paper_id")
+        _validate_paper_id(self.paper_id)
+        _validate_max_limit(self.limit)
+        _validate_min_limit(self.limit)
         if self.fields:
             _validate_fields(self.fields, AuthorDetailFields.VALID_FIELDS)
 
     def to_params(self) -> dict[str, Any]:
         params = {"offset": self.offset, "limit": self.limit}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -319,17 +389,17 @@ class PaperCitationsRequest(RequestModel):
         return f"/paper/{self.paper_id}/citations"
 
     def __post_init__(self) -> None:
-        if not self.paper_id.strip():
-            _raise_validation("Paper ID cannot be empty", field="paper_id")
-        if self.limit > 1000:
-            _raise_validation("Limit cannot exceed 1000", {"max_limit": 1000}, field="limit")
+        _require_text(self.paper_id, "Paper ID cannot be empty", "paper_id")
+        _validate_paper_id(self.paper_id)
+        _validate_max_limit(self.limit)
+        _validate_min_limit(self.limit)
         if self.fields:
             _validate_fields(self.fields, CitationReferenceFields.VALID_FIELDS)
 
     def to_params(self) -> dict[str, Any]:
         params = {"offset": self.offset, "limit": self.limit}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -345,17 +415,17 @@ class PaperReferencesRequest(RequestModel):
         return f"/paper/{self.paper_id}/references"
 
     def __post_init__(self) -> None:
-        if not self.paper_id.strip():
-            _raise_validation("Paper ID cannot be empty", field="paper_id")
-        if self.limit > 1000:
-            _raise_validation("Limit cannot exceed 1000", {"max_limit": 1000}, field="limit")
+        _require_text(self.paper_id, "Paper ID cannot be empty", "paper_id")
+        _validate_paper_id(self.paper_id)
+        _validate_max_limit(self.limit)
+        _validate_min_limit(self.limit)
         if self.fields:
             _validate_fields(self.fields, CitationReferenceFields.VALID_FIELDS)
 
     def to_params(self) -> dict[str, Any]:
         params = {"offset": self.offset, "limit": self.limit}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -368,8 +438,7 @@ class PaperAutocompleteRequest(RequestModel):
         return "/paper/autocomplete"
 
     def __post_init__(self) -> None:
-        if not self.query.strip():
-            _raise_validation("Query string cannot be empty", field="query")
+        _require_text(self.query, "Query string cannot be empty", "query")
 
     def to_params(self) -> dict[str, Any]:
         return {"query": self.query[:100]}
@@ -394,12 +463,9 @@ class SnippetSearchRequest(RequestModel):
         return "/snippet/search"
 
     def __post_init__(self) -> None:
-        if not self.query.strip():
-            _raise_validation("Query string cannot be empty", field="query")
-        if self.limit > 1000:
-            _raise_validation("Limit cannot exceed 1000", {"max_limit": 1000}, field="limit")
-        if self.limit < 1:
-            _raise_validation("Limit must be at least 1", {"min_limit": 1}, field="limit")
+        _require_text(self.query, "Query string cannot be empty", "query")
+        _validate_max_limit(self.limit)
+        _validate_min_limit(self.limit)
         if self.authors and len(self.authors) > 10:
             _raise_validation("Cannot filter by more than 10 authors", {"max_authors": 10}, field="authors")
         if self.paper_ids and len(self.paper_ids) > 100:
@@ -408,15 +474,16 @@ class SnippetSearchRequest(RequestModel):
                 {"max_paper_ids": 100},
                 field="paper_ids",
             )
+        _validate_year(self.year)
 
     def to_params(self) -> dict[str, Any]:
         params = {"query": self.query, "limit": self.limit}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         if self.paper_ids:
-            params["paperIds"] = ",".join(self.paper_ids)
+            params["paperIds"] = _csv(self.paper_ids)
         if self.authors:
-            params["authors"] = ",".join(self.authors)
+            params["authors"] = _csv(self.authors)
         if self.min_citation_count is not None:
             params["minCitationCount"] = self.min_citation_count
         if self.inserted_before:
@@ -426,9 +493,9 @@ class SnippetSearchRequest(RequestModel):
         if self.year:
             params["year"] = self.year
         if self.venue:
-            params["venue"] = ",".join(self.venue)
+            params["venue"] = _csv(self.venue)
         if self.fields_of_study:
-            params["fieldsOfStudy"] = ",".join(self.fields_of_study)
+            params["fieldsOfStudy"] = _csv(self.fields_of_study)
         return params
 
 
@@ -444,17 +511,15 @@ class AuthorSearchRequest(RequestModel):
         return "/author/search"
 
     def __post_init__(self) -> None:
-        if not self.query.strip():
-            _raise_validation("Query string cannot be empty", field="query")
-        if self.limit > 1000:
-            _raise_validation("Limit cannot exceed 1000", {"max_limit": 1000}, field="limit")
+        _require_text(self.query, "Query string cannot be empty", "query")
+        _validate_max_limit(self.limit)
         if self.fields:
             _validate_fields(self.fields, AuthorDetailFields.VALID_FIELDS)
 
     def to_params(self) -> dict[str, Any]:
         params = {"query": self.query, "offset": self.offset, "limit": self.limit}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -468,15 +533,14 @@ class AuthorDetailsRequest(RequestModel):
         return f"/author/{self.author_id}"
 
     def __post_init__(self) -> None:
-        if not self.author_id.strip():
-            _raise_validation("Author ID cannot be empty", field="author_id")
+        _require_text(self.author_id, "Author ID cannot be empty", "author_id")
         if self.fields:
             _validate_fields(self.fields, AuthorDetailFields.VALID_FIELDS)
 
     def to_params(self) -> dict[str, Any]:
         params = {}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -492,15 +556,14 @@ class AuthorPapersRequest(RequestModel):
         return f"/author/{self.author_id}/papers"
 
     def __post_init__(self) -> None:
-        if not self.author_id.strip():
-            _raise_validation("Author ID cannot be empty", field="author_id")
-        if self.limit > 1000:
-            _raise_validation("Limit cannot exceed 1000", {"max_limit": 1000}, field="limit")
+        _require_text(self.author_id, "Author ID cannot be empty", "author_id")
+        _validate_max_limit(self.limit)
+        _validate_min_limit(self.limit)
 
     def to_params(self) -> dict[str, Any]:
         params = {"offset": self.offset, "limit": self.limit}
         if self.fields:
-            params["fields"] = ",".join(self.fields)
+            params["fields"] = _join_fields(tuple(self.fields))
         return params
 
 
@@ -517,12 +580,14 @@ class AuthorBatchDetailsRequest(RequestModel):
     def __post_init__(self) -> None:
         if not self.author_ids:
             _raise_validation("Author IDs list cannot be empty", field="author_ids")
-        if len(self.author_ids) > 1000:
+        if len(self.author_ids) > Config.MAX_BATCH_IDS:
             _raise_validation(
-                "Cannot process more than 1000 author IDs at once",
-                {"max_authors": 1000, "received": len(self.author_ids)},
+                f"Cannot process more than {Config.MAX_BATCH_IDS} author IDs at once",
+                {"max_authors": Config.MAX_BATCH_IDS, "received": len(self.author_ids)},
                 field="author_ids",
             )
+        if any(type(author_id) is not str or not author_id.strip() for author_id in self.author_ids):
+            _raise_validation("Author IDs must be non-empty strings", field="author_ids")
         if self.fields:
             _validate_csv_fields(self.fields, AuthorDetailFields.VALID_FIELDS)
 
@@ -536,6 +601,19 @@ class AuthorBatchDetailsRequest(RequestModel):
         return {"ids": self.author_ids}
 
 
+_MAX_RECOMMENDATIONS = 500
+_RECOMMENDATION_POOLS = frozenset(VALID_RECOMMENDATION_POOLS)
+
+
+def _validate_recommendation_limit(limit: int) -> None:
+    if limit > _MAX_RECOMMENDATIONS:
+        _raise_validation(
+            f"Cannot request more than {_MAX_RECOMMENDATIONS} recommendations",
+            {"max_limit": _MAX_RECOMMENDATIONS, "requested": limit},
+            field="limit",
+        )
+
+
 @dataclass(slots=True)
 class PaperRecommendationsSingleRequest(RequestModel):
     paper_id: str
@@ -549,13 +627,8 @@ class PaperRecommendationsSingleRequest(RequestModel):
         return f"/papers/forpaper/{self.paper_id}"
 
     def __post_init__(self) -> None:
-        if self.limit > 500:
-            _raise_validation(
-                "Cannot request more than 500 recommendations",
-                {"max_limit": 500, "requested": self.limit},
-                field="limit",
-            )
-        if self.from_pool not in VALID_RECOMMENDATION_POOLS:
+        _validate_recommendation_limit(self.limit)
+        if self.from_pool not in _RECOMMENDATION_POOLS:
             _raise_validation(
                 "Invalid paper pool specified",
                 {"valid_pools": list(VALID_RECOMMENDATION_POOLS)},
@@ -585,12 +658,7 @@ class PaperRecommendationsMultiRequest(RequestModel):
     def __post_init__(self) -> None:
         if not self.positive_paper_ids:
             _raise_validation("Must provide at least one positive paper ID", field="positive_paper_ids")
-        if self.limit > 500:
-            _raise_validation(
-                "Cannot request more than 500 recommendations",
-                {"max_limit": 500, "requested": self.limit},
-                field="limit",
-            )
+        _validate_recommendation_limit(self.limit)
 
     def to_params(self) -> dict[str, Any]:
         params = {"limit": self.limit}
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 import random
+import re
 import time
 from collections import deque
+from functools import lru_cache, partial
 from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
 
 import httpx
+import orjson
 
 from ..config import Config, ErrorType, RateLimitConfig
 from ..utils.logger import logger
+from .cache import TieredCache, TTLCache
 from .exceptions import (
     S2ApiError,
     S2Error,
@@ -20,10 +25,60 @@ from .exceptions import (
     S2ValidationError,
 )
 
+USER_AGENT = "semantic-scholar-mcp/1.0 (+https://github.com/zongmin-yu/semantic-scholar-fastmcp-mcp-server)"
+
 # Global HTTP client for connection pooling
 http_client: Optional[httpx.AsyncClient] = None
 
 
+# Successful lookups, paper searches and single-paper recommendations kept
+# when Config.ENABLE_CACHING is on
+response_cache = TTLCache(maxsize=Config.CACHE_SIZE, ttl=Config.CACHE_TTL)
+
+# response_cache backed by Config.CACHE_DIR on disk; opened by initialize_client
+tiered_cache: Optional[TieredCache] = None
+
+# (status, response text, retry-after, authenticated) of upstream 400s and
+# final 429s, replayed for Config.ERROR_CACHE_TTL seconds; keyed like _inflight.
+error_cache = TTLCache(maxsize=Config.CACHE_SIZE, ttl=Config.ERROR_CACHE_TTL)
+
+# API key values treated as "no key" (e.g. SEMANTIC_SCHOLAR_API_KEY=none)
+_PLACEHOLDER_KEYS = frozenset(("", "none", "null", "false"))
+
+# Upstream requests currently in flight, keyed like the response cache plus
+# the API key override and the encoded request body.
+_inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+_CACHEABLE_ENDPOINTS = re.compile(
+    r"^/author/(?!search$|batch$)[^/]+(?:/papers)?$"
+    r"|^/paper/(?!search(?:/|$)|batch$|autocomplete$)[^/]+(?:/authors|/citations|/references)?$"
+    r"|^/paper/search(?:/match)?$"
+    r"|^/papers/forpaper/[^/]+$"
+)
+
+# One pass over the endpoint picks its rate-limit bucket. Search, batch and
+# recommendation endpoints are expensive upstream and get the stricter limits;
+# anything unmatched (e.g. /paper/{id}) shares "/default".
+_BUCKET_PATTERN = re.compile(r"recommendations|/author/search|/paper/search|/paper/batch|/author/batch")
+_BUCKET_FOR_MATCH = {
+    "recommendations": "/recommendations",
+    "/author/search": "/author/search",
+    "/paper/search": "/paper/search",
+    "/paper/batch": "/paper/batch",
+    "/author/batch": "/author/batch",
+}
+# RateLimitConfig attribute per bucket, read at call time so limits can be
+# adjusted at runtime.
+_BUCKET_LIMITS = {
+    "/recommendations": "RECOMMENDATIONS_LIMIT",
+    "/author/search": "SEARCH_LIMIT",
+    "/paper/search": "SEARCH_LIMIT",
+    "/paper/batch": "BATCH_LIMIT",
+    "/author/batch": "BATCH_LIMIT",
+    "/default": "DEFAULT_LIMIT",
+}
+
+
 class RateLimiter:
     """
     Rate limiter for API requests to prevent exceeding API limits.
@@ -37,8 +92,9 @@ class RateLimiter:
     ):
         self._clock = clock or time.monotonic
         self._sleep = sleeper or asyncio.sleep
-        self._events: Dict[str, Deque[float]] = {}
-        self._locks: Dict[str, asyncio.Lock] = {}
+        # Send times (past and reserved) for every bucket _bucket_key can
+        # return, created up front so acquire() does a single lookup.
+        self._buckets: Dict[str, Deque[float]] = {bucket: deque() for bucket in _BUCKET_LIMITS}
 
     def _bucket_key(self, endpoint: str, base_url: Optional[str] = None) -> str:
         """
@@ -49,31 +105,59 @@ class RateLimiter:
         """
         if base_url and "recommendations" in base_url:
             return "/recommendations"
-        if "recommendations" in endpoint:
-            return "/recommendations"
-        if "/author/search" in endpoint:
-            return "/author/search"
-        if "/paper/search" in endpoint:
-            return "/paper/search"
-        if "/paper/batch" in endpoint:
-            return "/paper/batch"
-        if "/author/batch" in endpoint:
-            return "/author/batch"
-        return "/default"
-
-    def _get_rate_limit(self, endpoint: str, *, authenticated: bool) -> Tuple[int, int]:
-        """Get the appropriate rate limit for an endpoint."""
+        match = _BUCKET_PATTERN.search(endpoint)
+        return _BUCKET_FOR_MATCH[match.group()] if match else "/default"
+
+    def _get_rate_limit(self, bucket: str, *, authenticated: bool) -> Tuple[int, int]:
+        """Get the rate limit for a bucket returned by ``_bucket_key``."""
         if not authenticated:
             return RateLimitConfig.UNAUTHENTICATED_LIMIT
-        if any(restricted in endpoint for restricted in RateLimitConfig.RESTRICTED_ENDPOINTS):
-            if "batch" in endpoint:
-                return RateLimitConfig.BATCH_LIMIT
-            if "search" in endpoint:
-                return RateLimitConfig.SEARCH_LIMIT
-            if "recommendations" in endpoint:
-                return RateLimitConfig.RECOMMENDATIONS_LIMIT
-            return RateLimitConfig.SEARCH_LIMIT
-        return RateLimitConfig.DEFAULT_LIMIT
+        return getattr(RateLimitConfig, _BUCKET_LIMITS[bucket])
+
+    def _reserve(
+        self,
+        endpoint: str,
+        *,
+        authenticated: bool,
+        base_url: Optional[str],
+        wait: bool,
+    ) -> Optional[float]:
+        """
+        Reserve the next send slot and return its time on ``self._clock``.
+
+        With ``wait=False`` nothing is reserved unless a slot is free right
+        now, and None is returned instead.
+        """
+        bucket = self._bucket_key(endpoint, base_url)
+        requests, seconds = self._get_rate_limit(bucket, authenticated=authenticated)
+        if requests <= 0 or seconds <= 0:
+            return self._clock()
+
+        # Nothing awaits between reading and updating the window, so callers
+        # get slots in arrival order without a lock. The deque may hold
+        # future slots; the newest ``requests`` entries define the next one.
+        events = self._buckets[bucket]
+        now = self._clock()
+        cutoff = now - seconds
+        while events and events[0] <= cutoff:
+            events.popleft()
+
+        slot = now if len(events) < requests else events[-requests] + seconds
+        if slot > now and not wait:
+            return None
+        events.append(slot)
+        return slot
+
+    def _release(self, endpoint: str, base_url: Optional[str], slot: float) -> None:
+        """
+        Hand back a slot whose caller was cancelled before sending.
+
+        Only the newest reservation can go: later ones were scheduled around
+        the older ones, so removing those would not make room any sooner.
+        """
+        events = self._buckets[self._bucket_key(endpoint, base_url)]
+        if events and events[-1] == slot:
+            events.pop()
 
     async def acquire(
         self,
@@ -88,72 +172,123 @@ class RateLimiter:
         Args:
             endpoint: The API endpoint being accessed.
         """
-        bucket = self._bucket_key(endpoint, base_url)
-        if bucket not in self._locks:
-            self._locks[bucket] = asyncio.Lock()
-            self._events[bucket] = deque()
-
-        async with self._locks[bucket]:
-            limit_endpoint = bucket if bucket != "/default" else endpoint
-            requests, seconds = self._get_rate_limit(limit_endpoint, authenticated=authenticated)
-            if requests <= 0 or seconds <= 0:
-                return
-
-            events = self._events[bucket]
-            while True:
-                now = self._clock()
-                cutoff = now - float(seconds)
-                while events and events[0] <= cutoff:
-                    events.popleft()
-
-                if len(events) < int(requests):
-                    events.append(now)
-                    return
+        slot = self._reserve(endpoint, authenticated=authenticated, base_url=base_url, wait=True)
+        delay = slot - self._clock()
+        if delay > 0:
+            try:
+                await self._sleep(delay)
+            except asyncio.CancelledError:
+                self._release(endpoint, base_url, slot)
+                raise
 
-                delay = (events[0] + float(seconds)) - now
-                if delay > 0:
-                    await self._sleep(delay)
+    def try_acquire(
+        self,
+        endpoint: str,
+        *,
+        authenticated: bool = True,
+        base_url: Optional[str] = None,
+    ) -> bool:
+        """Take a send slot only if one is free right now; never waits."""
+        return self._reserve(endpoint, authenticated=authenticated, base_url=base_url, wait=False) is not None
 
 
 rate_limiter = RateLimiter()
 
 
+@lru_cache(maxsize=1)
 def get_api_key() -> Optional[str]:
     """
     Get the Semantic Scholar API key from environment variables.
     Returns None if no API key is set, enabling unauthenticated access.
+
+    The environment is read once and the key is returned already normalized;
+    call ``get_api_key.cache_clear()`` (and recreate the HTTP client) after
+    rotating the key.
     """
-    api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    raw_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    api_key = _normalize_key(raw_key)
     if api_key:
-        norm = api_key.strip().lower()
-        if norm in ("", "none", "null", "false"):
-            logger.warning(
-                "SEMANTIC_SCHOLAR_API_KEY is set to a placeholder value; treating as not set."
-            )
-            return None
         return api_key
+    if raw_key:
+        logger.warning(
+            "SEMANTIC_SCHOLAR_API_KEY is set to a placeholder value; treating as not set."
+        )
+        return None
 
     logger.warning("No SEMANTIC_SCHOLAR_API_KEY set. Using unauthenticated access with lower rate limits.")
     return None
 
 
+def _open_tiered_cache() -> Optional[TieredCache]:
+    try:
+        import diskcache
+    except ImportError:
+        logger.warning(
+            "SEMANTIC_SCHOLAR_CACHE_DIR is set but diskcache is not installed; caching in memory only."
+        )
+        return None
+    return TieredCache(response_cache, diskcache.Cache(Config.CACHE_DIR), disk_ttl=Config.CACHE_DISK_TTL)
+
+
 async def initialize_client() -> httpx.AsyncClient:
     """Initialize the global HTTP client."""
-    global http_client
+    global http_client, tiered_cache
     if http_client is None:
+        # The environment key and User-Agent ride on every request as client
+        # defaults; only per-call overrides need their own headers.
+        headers = {"User-Agent": USER_AGENT}
+        api_key = get_api_key()
+        if api_key:
+            headers["x-api-key"] = api_key
         http_client = httpx.AsyncClient(
-            timeout=Config.TIMEOUT,
-            limits=httpx.Limits(max_keepalive_connections=10),
+            headers=headers,
+            timeout=httpx.Timeout(Config.TIMEOUT, connect=Config.CONNECT_TIMEOUT),
+            http2=Config.HTTP2,
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+            ),
         )
+        if Config.ENABLE_CACHING and Config.CACHE_DIR and tiered_cache is None:
+            tiered_cache = await asyncio.to_thread(_open_tiered_cache)
     return http_client
 
 
 async def cleanup_client() -> None:
     """Clean up the global HTTP client."""
-    global http_client
+    global http_client, tiered_cache
     if http_client is not None:
         await http_client.aclose()
         http_client = None
+    if tiered_cache is not None:
+        await asyncio.to_thread(tiered_cache.close)
+        tiered_cache = None
+
+
+def _finish_flight(key: Tuple[Any, ...], task: asyncio.Future) -> None:
+    _inflight.pop(key, None)
+    # Every caller may have been cancelled; retrieve the outcome so a failure
+    # nobody awaits is not logged as "Task exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
+
+
+def _is_cacheable(method: str, endpoint: str) -> bool:
+    return method.upper() == "GET" and bool(_CACHEABLE_ENDPOINTS.match(endpoint))
+
+
+def _cache_key(method: str, url: str, params: Optional[dict[str, Any]]) -> Tuple[Any, ...]:
+    return (method.upper(), url, tuple(sorted((params or {}).items())))
+
+
+def _response_cache_key(method: str, url: str, params: Optional[dict[str, Any]]) -> Tuple[Any, ...]:
+    # Search queries that differ only in case or spacing share an entry;
+    # every other parameter (filters, fields, paging) still has to match.
+    query = (params or {}).get("query")
+    if isinstance(query, str):
+        params = {**params, "query": " ".join(query.split()).casefold()}
+    return _cache_key(method, url, params)
 
 
 def _redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
@@ -164,11 +299,32 @@ def _redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
     return redacted
 
 
+# Per-request headers for calls without an override key, shared between calls.
+_NO_BODY_HEADERS: Dict[str, str] = {}
+_JSON_BODY_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+
+def _request_headers(override_key: Optional[str], has_body: bool) -> Dict[str, str]:
+    """
+    Per-request headers layered over the client defaults.
+
+    Without an override key a shared dict is returned, so callers must not
+    mutate it. Override keys (e.g. bridge callers' bearer tokens) get a fresh
+    dict and are never cached, so they do not outlive the request.
+    """
+    if not override_key:
+        return _JSON_BODY_HEADERS if has_body else _NO_BODY_HEADERS
+    headers = {"x-api-key": override_key}
+    if has_body:
+        headers["Content-Type"] = "application/json"
+    return headers
+
+
 def _normalize_key(key: Optional[str]) -> Optional[str]:
     if not key:
         return None
     normalized = str(key).strip()
-    if normalized.lower() in ("", "none", "null", "false"):
+    if normalized.lower() in _PLACEHOLDER_KEYS:
         return None
     return normalized
 
@@ -246,42 +402,159 @@ class S2Transport:
         json: Any = None,
         base_url: Optional[str] = None,
     ) -> Any:
-        api_key = _normalize_key(api_key_override) or _normalize_key(get_api_key())
-        authenticated = bool(api_key)
-
-        await rate_limiter.acquire(endpoint, authenticated=authenticated, base_url=base_url)
-
-        if api_key:
-            headers = {"x-api-key": api_key}
-        else:
-            headers = {}
-            logger.debug("Not sending x-api-key header (no valid API key available)")
-
-        headers.setdefault(
-            "User-Agent",
-            "semantic-scholar-mcp/1.0 (+https://github.com/zongmin-yu/semantic-scholar-fastmcp-mcp-server)",
-        )
+        """
+        Send a request and return the decoded JSON body.
 
+        Cached responses and results shared by identical in-flight requests
+        are the same object for every caller, so treat the result as
+        read-only and copy it before changing it.
+        """
         if endpoint.startswith("http://") or endpoint.startswith("https://"):
             url = endpoint
         else:
             url = f"{base_url or Config.BASE_URL}{endpoint}"
 
+        cache_key = None
+        if Config.ENABLE_CACHING and _is_cacheable(method, endpoint):
+            cache_key = _response_cache_key(method, url, params)
+            if tiered_cache is not None:
+                cached = await tiered_cache.get(cache_key)
+            else:
+                cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        body = orjson.dumps(json) if json is not None else None
+        flight_key = _cache_key(method, url, params) + (_normalize_key(api_key_override), body)
+        error_key = None
+        if Config.ERROR_CACHE_TTL > 0:
+            error_key = flight_key
+            cached_error = error_cache.get(error_key)
+            if cached_error is not None:
+                status_code, response_text, retry_after, authenticated = cached_error
+                raise self._status_error(
+                    status_code,
+                    response_text,
+                    retry_after=retry_after,
+                    authenticated=authenticated,
+                    endpoint=endpoint,
+                    method=method,
+                    params=params,
+                    json=json,
+                    base_url=base_url,
+                )
+
+        send = partial(
+            self._send,
+            url,
+            endpoint,
+            params=params,
+            api_key_override=api_key_override,
+            method=method,
+            json=json,
+            body=body,
+            base_url=base_url,
+            cache_key=cache_key,
+            error_key=error_key,
+        )
+        if not Config.DEDUPE_INFLIGHT:
+            return await send()
+
+        # Identical requests already in flight share one upstream call. Every
+        # endpoint this client uses is read-only, POST batches included. The
+        # shared task is shielded so a cancelled caller does not cancel the others.
+        task = _inflight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(send())
+            _inflight[flight_key] = task
+            task.add_done_callback(partial(_finish_flight, flight_key))
+        return await asyncio.shield(task)
+
+    async def _hedged(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        endpoint: str,
+        *,
+        authenticated: bool,
+        base_url: Optional[str],
+    ) -> httpx.Response:
+        """
+        Send a GET, and a backup copy if it is still pending after
+        Config.HEDGE_AFTER seconds; the first to answer wins.
+
+        The backup only goes out when the rate limiter has a free slot right
+        now, so hedging never pushes the client past its limits.
+        """
+        primary = asyncio.ensure_future(send())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=Config.HEDGE_AFTER)
+            if done or not rate_limiter.try_acquire(endpoint, authenticated=authenticated, base_url=base_url):
+                return await primary
+            logger.debug("Hedging slow request for %s", endpoint)
+            tasks.add(asyncio.ensure_future(send()))
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None or not tasks:
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(
+        self,
+        url: str,
+        endpoint: str,
+        *,
+        params: Optional[dict[str, Any]],
+        api_key_override: Optional[str],
+        method: str,
+        json: Any,
+        body: Optional[bytes],
+        base_url: Optional[str],
+        cache_key: Optional[Tuple[Any, ...]],
+        error_key: Optional[Tuple[Any, ...]] = None,
+    ) -> Any:
+        override_key = _normalize_key(api_key_override)
+        authenticated = bool(override_key or get_api_key())
+
+        await rate_limiter.acquire(endpoint, authenticated=authenticated, base_url=base_url)
+
+        if not authenticated:
+            logger.debug("Not sending x-api-key header (no valid API key available)")
+        headers = _request_headers(override_key, body is not None)
+
         last_rate_limit_exc: Optional[S2RateLimitError] = None
 
         for attempt in range(self.MAX_RETRIES + 1):
             try:
                 client = await initialize_client()
-                logger.debug(
-                    "Semantic Scholar request: method=%s url=%s params=%s headers=%s",
-                    method,
-                    url,
-                    params,
-                    _redact_headers(headers),
-                )
-                response = await client.request(method.upper(), url, params=params, headers=headers, json=json)
+                debug = logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug(
+                        "Semantic Scholar request: method=%s url=%s params=%s headers=%s",
+                        method,
+                        url,
+                        params,
+                        _redact_headers(headers),
+                    )
+                send = partial(client.request, method.upper(), url, params=params or None, headers=headers, content=body)
+                if Config.HEDGE_AFTER > 0 and method.upper() == "GET":
+                    response = await self._hedged(send, endpoint, authenticated=authenticated, base_url=base_url)
+                else:
+                    response = await send()
+                if debug:
+                    logger.debug("Semantic Scholar response: url=%s http_version=%s", url, response.http_version)
                 response.raise_for_status()
-                return response.json()
+                data = orjson.loads(response.content)
+                if cache_key is not None:
+                    if tiered_cache is not None:
+                        await tiered_cache.set(cache_key, data)
+                    else:
+                        response_cache.set(cache_key, data)
+                return data
             except httpx.HTTPStatusError as exc:
                 try:
                     logger.error("HTTP error %s for %s: %s", exc.response.status_code, url, exc.response.text)
@@ -295,18 +568,16 @@ class S2Transport:
 
                 if status_code == 429:
                     retry_after = exc.response.headers.get("retry-after")
-                    last_rate_limit_exc = S2RateLimitError(
-                        message="Rate limit exceeded. Consider using an API key for higher limits.",
-                        details={},
-                        status_code=429,
+                    last_rate_limit_exc = self._status_error(
+                        429,
+                        response_text,
+                        retry_after=retry_after,
+                        authenticated=authenticated,
                         endpoint=endpoint,
                         method=method,
                         params=params,
-                        json_body=json,
+                        json=json,
                         base_url=base_url,
-                        response_text=response_text,
-                        retry_after=retry_after,
-                        authenticated=authenticated,
                     )
                     last_rate_limit_exc.__cause__ = exc
 
@@ -319,19 +590,28 @@ class S2Transport:
                         await asyncio.sleep(delay)
                         continue
 
+                    if error_key is not None:
+                        error_cache.set(
+                            error_key,
+                            (429, response_text, retry_after, authenticated),
+                            ttl=min(self._retry_after_seconds(retry_after), Config.ERROR_CACHE_TTL),
+                        )
                     raise last_rate_limit_exc from exc
 
-                error_cls = S2NotFoundError if status_code == 404 else S2ApiError
-                raise error_cls(
-                    message=f"HTTP error: {status_code}",
-                    details={},
-                    status_code=status_code,
+                if error_key is not None and status_code == 400:
+                    error_cache.set(
+                        error_key,
+                        (status_code, response_text, None, authenticated),
+                        ttl=Config.ERROR_CACHE_TTL,
+                    )
+                raise self._status_error(
+                    status_code,
+                    response_text,
                     endpoint=endpoint,
                     method=method,
                     params=params,
-                    json_body=json,
+                    json=json,
                     base_url=base_url,
-                    response_text=response_text,
                 ) from exc
             except httpx.TimeoutException as exc:
                 logger.error("Request timeout for %s: %s", endpoint, str(exc))
@@ -360,6 +640,53 @@ class S2Transport:
         assert last_rate_limit_exc is not None
         raise last_rate_limit_exc
 
+    @staticmethod
+    def _status_error(
+        status_code: int,
+        response_text: str,
+        *,
+        retry_after: Optional[str] = None,
+        authenticated: bool = False,
+        endpoint: str,
+        method: str,
+        params: Optional[dict[str, Any]],
+        json: Any,
+        base_url: Optional[str],
+    ) -> S2ApiError:
+        if status_code == 429:
+            return S2RateLimitError(
+                message="Rate limit exceeded. Consider using an API key for higher limits.",
+                details={},
+                status_code=429,
+                endpoint=endpoint,
+                method=method,
+                params=params,
+                json_body=json,
+                base_url=base_url,
+                response_text=response_text,
+                retry_after=retry_after,
+                authenticated=authenticated,
+            )
+        error_cls = S2NotFoundError if status_code == 404 else S2ApiError
+        return error_cls(
+            message=f"HTTP error: {status_code}",
+            details={},
+            status_code=status_code,
+            endpoint=endpoint,
+            method=method,
+            params=params,
+            json_body=json,
+            base_url=base_url,
+            response_text=response_text,
+        )
+
+    @staticmethod
+    def _retry_after_seconds(retry_after: Optional[str]) -> float:
+        try:
+            return max(float(retry_after), 1.0)
+        except (ValueError, TypeError):
+            return 1.0
+
     @staticmethod
     def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
         """Calculate delay with exponential backoff + jitter, respecting retry-after header."""
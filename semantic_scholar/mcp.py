@@ -2,7 +2,22 @@
 Central definition of the FastMCP instance.
 """
 
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
+from .utils.http import cleanup_client, initialize_client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Open the shared HTTP client for the lifetime of the MCP server."""
+    await initialize_client()
+    try:
+        yield
+    finally:
+        await cleanup_client()
+
+
 # Create FastMCP instance
-mcp = FastMCP("Semantic Scholar Server") 
\ No newline at end of file
+mcp = FastMCP("Semantic Scholar Server", lifespan=lifespan)
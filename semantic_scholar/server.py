@@ -4,8 +4,12 @@ Main server module for the Semantic Scholar API Server.
 
 import asyncio
 import os
-import uvicorn
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    import uvicorn
+
+from .config import env_flag
 # Import mcp from centralized location
 from .mcp import mcp
 from .utils.http import initialize_client, cleanup_client
@@ -18,6 +22,41 @@ from .api import papers, authors, recommendations
 _TASK_CANCEL_TIMEOUT = 5  # seconds to wait for tasks to finish on shutdown
 
 
+def _build_bridge_server() -> Optional["uvicorn.Server"]:
+    """
+    Build the uvicorn server for the HTTP bridge, or None when it is disabled.
+
+    The bridge (``bridge.app``) is a thin FastAPI application served in the
+    same process and event loop as MCP, reusing the package HTTP utilities.
+    """
+    enable_bridge = env_flag("SEMANTIC_SCHOLAR_ENABLE_HTTP_BRIDGE", "1")
+    if not enable_bridge:
+        return None
+
+    bridge_host = os.getenv("SEMANTIC_SCHOLAR_HTTP_BRIDGE_HOST", "0.0.0.0").strip()
+    bridge_port = int(os.getenv("SEMANTIC_SCHOLAR_HTTP_BRIDGE_PORT", "8000"))
+    limit_concurrency = os.getenv("SEMANTIC_SCHOLAR_HTTP_BRIDGE_LIMIT_CONCURRENCY", "").strip()
+    keep_alive = int(os.getenv("SEMANTIC_SCHOLAR_HTTP_BRIDGE_KEEPALIVE", "5"))
+    # Imported here so MCP-only deployments skip loading uvicorn and FastAPI.
+    import uvicorn
+
+    from .bridge import app as bridge_app
+    # The bridge shares the running event loop (uvloop when installed);
+    # http="auto" picks the httptools parser when it is available.
+    config = uvicorn.Config(
+        app=bridge_app,
+        host=bridge_host,
+        port=bridge_port,
+        log_level="info",
+        log_config=None,
+        http="auto",
+        ws="none",  # Disable WebSocket support to avoid deprecation warnings
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
+        timeout_keep_alive=keep_alive,
+    )
+    return uvicorn.Server(config=config)
+
+
 async def run_server():
     """Run the server with proper async context management."""
     tasks: list[asyncio.Task] = []
@@ -39,30 +78,10 @@ async def run_server():
             mcp_task = asyncio.create_task(mcp.run_async())
         tasks.append(mcp_task)
 
-        # Start the HTTP bridge (ASGI) in the same process so the service
-        # exposes REST endpoints on a local port. The `bridge.app` is a thin
-        # FastAPI application that reuses the package HTTP utilities.
-        enable_bridge = os.getenv("SEMANTIC_SCHOLAR_ENABLE_HTTP_BRIDGE", "1").strip().lower() in (
-            "1",
-            "true",
-            "yes",
-            "on",
-        )
-        if enable_bridge:
-            bridge_host = os.getenv("SEMANTIC_SCHOLAR_HTTP_BRIDGE_HOST", "0.0.0.0").strip()
-            bridge_port = int(os.getenv("SEMANTIC_SCHOLAR_HTTP_BRIDGE_PORT", "8000"))
-            from .bridge import app as bridge_app
-            config = uvicorn.Config(
-                app=bridge_app,
-                host=bridge_host,
-                port=bridge_port,
-                log_level="info",
-                log_config=None,
-                ws="none",  # Disable WebSocket support to avoid deprecation warnings
-            )
-            bridge_server = uvicorn.Server(config=config)
+        bridge_server = _build_bridge_server()
+        if bridge_server is not None:
             tasks.append(asyncio.create_task(bridge_server.serve()))
-            logger.info("HTTP bridge enabled on %s:%s", bridge_host, bridge_port)
+            logger.info("HTTP bridge enabled on %s:%s", bridge_server.config.host, bridge_server.config.port)
         else:
             logger.info("HTTP bridge disabled (SEMANTIC_SCHOLAR_ENABLE_HTTP_BRIDGE=0)")
 
@@ -98,10 +117,25 @@ async def run_server():
         logger.info("Shutdown complete")
 
 
+def _run(coro) -> None:
+    """Run ``coro`` on uvloop when it is installed and enabled, else the stock asyncio loop."""
+    uvloop = None
+    if env_flag("SEMANTIC_SCHOLAR_UVLOOP", "1"):
+        try:
+            import uvloop
+        except ImportError:
+            pass
+    if uvloop is None:
+        asyncio.run(coro)
+        return
+    logger.debug("Using uvloop event loop")
+    uvloop.run(coro)
+
+
 def main():
     """Main entry point for the server."""
     try:
-        asyncio.run(run_server())
+        _run(run_server())
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
     except Exception as e:
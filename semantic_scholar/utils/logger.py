@@ -2,10 +2,38 @@
 Centralized logging configuration for the Semantic Scholar server.
 """
 
+import atexit
 import logging
-import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Optional, Tuple
 
-DEBUG_REQUESTS = os.getenv("SEMANTIC_SCHOLAR_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
+from ..config import env_flag
 
-logging.basicConfig(level=logging.DEBUG if DEBUG_REQUESTS else logging.INFO)
+DEBUG_REQUESTS = env_flag("SEMANTIC_SCHOLAR_DEBUG", "0")
+# Hand records to a background thread so stderr writes never block the event loop
+QUEUE_LOGGING = env_flag("SEMANTIC_SCHOLAR_QUEUE_LOGGING", "0")
+
+
+def _queue_handler(stream: Optional[IO[str]] = None) -> Tuple[QueueHandler, QueueListener]:
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    # QueueHandler formats each record before enqueueing it (basicConfig gives
+    # it the usual format), so the stream handler writes the message as-is.
+    listener = QueueListener(records, logging.StreamHandler(stream), respect_handler_level=True)
+    listener.start()
+    return QueueHandler(records), listener
+
+
+# Only provide a default setup; an embedding application's own logging
+# configuration takes precedence.
+if not logging.getLogger().handlers:
+    handlers = None
+    if QUEUE_LOGGING:
+        handler, listener = _queue_handler()
+        atexit.register(listener.stop)
+        handlers = [handler]
+    logging.basicConfig(level=logging.DEBUG if DEBUG_REQUESTS else logging.INFO, handlers=handlers)
 logger = logging.getLogger("semantic_scholar")
+if DEBUG_REQUESTS:
+    # Honour SEMANTIC_SCHOLAR_DEBUG even when the root level came from elsewhere.
+    logger.setLevel(logging.DEBUG)
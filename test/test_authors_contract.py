@@ -1,6 +1,11 @@
+import asyncio
+
 import pytest
 
 import semantic_scholar.api.authors as authors_api
+from semantic_scholar.core.client import gather_bounded
+from semantic_scholar.core.coalesce import AuthorDetailsCoalescer
+from semantic_scholar.core.exceptions import S2ApiError
 
 
 pytestmark = pytest.mark.asyncio
@@ -202,6 +207,15 @@ async def test_author_batch_details_empty_ids_validation(mock_make_request):
     assert mock_make_request.calls == []
 
 
+async def test_author_batch_details_rejects_blank_ids(mock_make_request):
+    mock_make_request.install(authors_api)
+
+    result = await authors_api.author_batch_details.fn(None, author_ids=["1741101", "", "  "], fields="name")
+
+    assert_validation_error(result, "Author IDs must be non-empty strings")
+    assert mock_make_request.calls == []
+
+
 async def test_author_batch_details_rate_limit_passthrough(mock_make_request, mock_error_response):
     error = mock_error_response(status_code=429)
     mock_make_request.install(authors_api).queue_responses(error)
@@ -220,3 +234,142 @@ async def test_author_batch_details_rate_limit_passthrough(mock_make_request, mo
         method="POST",
         json={"ids": ["1741101", "2061296"]},
     )
+
+
+async def test_author_batch_details_chunks_large_requests(mock_make_request):
+    author_ids = [str(i) for i in range(1500)]
+    mock_make_request.install(authors_api).queue_responses(
+        [{"authorId": i} for i in author_ids[:1000]],
+        [{"authorId": i} for i in author_ids[1000:]],
+    )
+
+    result = await authors_api.author_batch_details.fn(None, author_ids=author_ids, fields="name")
+
+    assert [author["authorId"] for author in result] == author_ids
+    assert [len(call["json"]["ids"]) for call in mock_make_request.calls] == [1000, 500]
+
+
+@pytest.fixture
+def coalescing(monkeypatch):
+    monkeypatch.setattr(authors_api, "_author_coalescer", AuthorDetailsCoalescer(window=0.005))
+
+
+async def test_concurrent_author_details_coalesce_into_batch(mock_make_request, coalescing):
+    payload = [{"authorId": "1741101", "name": "Andrew Ng"}, None]
+    mock_make_request.install(authors_api).queue_responses(payload)
+
+    found, missing = await asyncio.gather(
+        authors_api.author_details.fn(None, author_id="1741101", fields=["name", "hIndex"]),
+        authors_api.author_details.fn(None, author_id="2061296", fields=["name", "hIndex"]),
+    )
+
+    assert found == {"authorId": "1741101", "name": "Andrew Ng"}
+    assert_validation_error(missing, "Author not found", {"author_id": "2061296"})
+    assert_single_call(
+        mock_make_request,
+        endpoint="/author/batch",
+        params={"fields": "name,hIndex"},
+        method="POST",
+        json={"ids": ["1741101", "2061296"]},
+    )
+
+
+async def test_failed_batch_falls_back_to_individual_lookups(
+    mock_make_request, mock_error_response, coalescing
+):
+    mock_make_request.install(authors_api).queue_responses(
+        mock_error_response(status_code=400, response="bad id"),
+        {"authorId": "1741101", "name": "Andrew Ng"},
+        mock_error_response(status_code=400, response="bad id"),
+    )
+
+    found, bad = await asyncio.gather(
+        authors_api.author_details.fn(None, author_id="1741101", fields=["name"]),
+        authors_api.author_details.fn(None, author_id="not an id", fields=["name"]),
+    )
+
+    assert found == {"authorId": "1741101", "name": "Andrew Ng"}
+    assert bad["error"]["details"]["status_code"] == 400
+    assert [(call["method"], call["endpoint"]) for call in mock_make_request.calls] == [
+        ("POST", "/author/batch"),
+        ("GET", "/author/1741101"),
+        ("GET", "/author/not an id"),
+    ]
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+async def test_failed_batch_is_not_fanned_out_when_upstream_is_struggling(
+    mock_make_request, mock_error_response, coalescing, status_code
+):
+    error = mock_error_response(status_code=status_code)
+    mock_make_request.install(authors_api).queue_responses(error)
+
+    first, second = await asyncio.gather(
+        authors_api.author_details.fn(None, author_id="1741101", fields=["name"]),
+        authors_api.author_details.fn(None, author_id="2061296", fields=["name"]),
+    )
+
+    assert first == second == error
+    assert [(call["method"], call["endpoint"]) for call in mock_make_request.calls] == [
+        ("POST", "/author/batch"),
+    ]
+
+
+async def test_author_papers_all_fetches_remaining_pages(mock_make_request):
+    mock_make_request.install(authors_api).queue_responses(
+        {"offset": 0, "next": 2, "data": [{"paperId": "p1"}, {"paperId": "p2"}]},
+        {"authorId": "1741101", "paperCount": 5},
+        {"offset": 2, "next": 4, "data": [{"paperId": "p3"}, {"paperId": "p4"}]},
+        {"offset": 4, "data": [{"paperId": "p5"}]},
+    )
+
+    result = await authors_api.author_papers_all.fn(None, author_id="1741101", fields=["title"], limit=2)
+
+    assert result == {
+        "offset": 0,
+        "total": 5,
+        "data": [{"paperId": f"p{i}"} for i in range(1, 6)],
+    }
+    assert [(call["endpoint"], call["params"]) for call in mock_make_request.calls] == [
+        ("/author/1741101/papers", {"offset": 0, "limit": 2, "fields": "title"}),
+        ("/author/1741101", {"fields": "paperCount"}),
+        ("/author/1741101/papers", {"offset": 2, "limit": 2, "fields": "title"}),
+        ("/author/1741101/papers", {"offset": 4, "limit": 2, "fields": "title"}),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message", "details"),
+    [
+        ({"limit": 0}, "Limit must be at least 1", {"min_limit": 1}),
+        ({"max_pages": 0}, "max_pages must be at least 1", {"min_max_pages": 1}),
+    ],
+)
+async def test_author_papers_all_rejects_empty_pages(mock_make_request, kwargs, message, details):
+    mock_make_request.install(authors_api)
+
+    result = await authors_api.author_papers_all.fn(None, author_id="1741101", **kwargs)
+
+    assert_validation_error(result, message, details)
+    assert mock_make_request.calls == []
+
+
+async def test_gather_bounded_cancels_the_rest_on_failure():
+    started, cancelled = [], []
+
+    async def page(index):
+        started.append(index)
+        if index == 0:
+            raise S2ApiError(message="HTTP error: 500", status_code=500)
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+
+    with pytest.raises(S2ApiError):
+        await gather_bounded((page(i) for i in range(5)), limit=2)
+    await asyncio.sleep(0)
+
+    assert len(started) < 5
+    assert sorted(cancelled) == started[1:]
@@ -168,6 +168,93 @@ async def test_bridge_recommendations_requires_paper_id(mock_make_request, bridg
     assert mock_make_request.calls == []
 
 
+async def test_bridge_recommendations_batch_contract(mock_make_request, bridge_client, auth_headers):
+    first = {"recommendedPapers": [{"paperId": "p8"}]}
+    second = {"recommendedPapers": [{"paperId": "p9"}]}
+    mock_make_request.install(bridge).queue_responses(first, second)
+
+    response = await bridge_client.post(
+        "/v1/recommendations/batch",
+        json={"ids": ["paper-1", "paper-2"]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [first, second]
+    assert [call["endpoint"] for call in mock_make_request.calls] == [
+        "/papers/forpaper/paper-1",
+        "/papers/forpaper/paper-2",
+    ]
+    assert all(
+        call["params"] == {"fields": Config.DEFAULT_FIELDS_CSV}
+        and call["api_key_override"] == "bridge-token"
+        and call["base_url"] == Config.RECOMMENDATIONS_BASE_URL
+        for call in mock_make_request.calls
+    )
+
+
+async def test_bridge_recommendations_batch_rejects_empty_ids(mock_make_request, bridge_client, auth_headers):
+    mock_make_request.install(bridge)
+
+    response = await bridge_client.post("/v1/recommendations/batch", json={"ids": []}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "error": {"type": "validation", "message": "Paper IDs list cannot be empty", "details": {}}
+    }
+    assert mock_make_request.calls == []
+
+
+async def test_bridge_recommendations_batch_rejects_non_string_ids(mock_make_request, bridge_client, auth_headers):
+    mock_make_request.install(bridge)
+
+    response = await bridge_client.post(
+        "/v1/recommendations/batch", json={"ids": ["paper-1", 7, " "]}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()["error"]["message"] == "Paper IDs must be non-empty strings"
+    assert mock_make_request.calls == []
+
+
+async def test_bridge_recommendations_batch_rejects_path_and_query_in_seeds(
+    mock_make_request, bridge_client, auth_headers
+):
+    mock_make_request.install(bridge)
+
+    response = await bridge_client.post(
+        "/v1/recommendations/batch",
+        json={"ids": ["paper-1", "abc?fields=authors", "x/../../"]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "error": {
+            "type": "validation",
+            "message": "Invalid paper ID format",
+            "details": {"invalid_indices": [1, 2]},
+        }
+    }
+    assert mock_make_request.calls == []
+
+
+async def test_bridge_recommendations_batch_reports_errors_per_seed(
+    mock_make_request, mock_error_response, bridge_client, auth_headers
+):
+    found = {"recommendedPapers": [{"paperId": "p8"}]}
+    missing = mock_error_response(status_code=404)
+    mock_make_request.install(bridge).queue_responses(found, missing)
+
+    response = await bridge_client.post(
+        "/v1/recommendations/batch", json={"ids": ["paper-1", "paper-2"]}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [found, missing]
+    assert len(mock_make_request.calls) == 2
+
+
 async def test_bridge_error_payload_passthrough(mock_make_request, mock_error_response, bridge_client, auth_headers):
     error = mock_error_response(status_code=404)
     mock_make_request.install(bridge).queue_responses(error)
@@ -187,3 +274,35 @@ async def test_bridge_error_payload_passthrough(mock_make_request, mock_error_re
         },
         api_key_override="bridge-token",
     )
+
+
+async def test_bridge_compresses_large_responses(mock_make_request, bridge_client, auth_headers):
+    payload = [{"paperId": f"p{i}", "title": "Attention Is All You Need"} for i in range(100)]
+    mock_make_request.install(bridge).queue_responses(payload)
+
+    response = await bridge_client.post(
+        "/v1/paper/batch",
+        json={"ids": ["p1"]},
+        headers={**auth_headers, "Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == payload
+
+
+async def test_bridge_batch_rejects_body_without_id_list(mock_make_request, bridge_client, auth_headers):
+    mock_make_request.install(bridge)
+
+    response = await bridge_client.post("/v1/author/batch", json={"ids": "1741101"}, headers=auth_headers)
+
+    assert response.status_code == 422
+    assert mock_make_request.calls == []
+
+
+async def test_bridge_ignores_non_bearer_authorization(mock_make_request, bridge_client):
+    mock_make_request.install(bridge).queue_responses({"paperId": "p1"})
+
+    response = await bridge_client.get("/v1/paper/p1", headers={"Authorization": "Basic dXNlcjpwYXNz"})
+
+    assert response.status_code == 200
+    assert mock_make_request.calls[0]["api_key_override"] is None
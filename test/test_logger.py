@@ -0,0 +1,20 @@
+import io
+import logging
+
+from semantic_scholar.utils.logger import _queue_handler
+
+
+def test_queue_handler_writes_each_record_once_from_the_listener():
+    stream = io.StringIO()
+    handler, listener = _queue_handler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    log = logging.getLogger("semantic_scholar.test_queue_logging")
+    log.propagate = False
+    log.addHandler(handler)
+    try:
+        log.warning("rate limited on %s", "/paper/search")
+    finally:
+        log.removeHandler(handler)
+        listener.stop()
+
+    assert stream.getvalue() == "WARNING semantic_scholar.test_queue_logging: rate limited on /paper/search\n"
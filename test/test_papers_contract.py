@@ -130,6 +130,17 @@ async def test_paper_bulk_search_invalid_sort_field(mock_make_request):
     assert mock_make_request.calls == []
 
 
+async def test_paper_relevance_search_rejects_malformed_year(mock_make_request):
+    result = await papers_api.paper_relevance_search.fn(None, query="transformer", year="2019-20")
+
+    assert_validation_error(
+        result,
+        "Invalid year format. Use YYYY, YYYY-YYYY, YYYY- or -YYYY",
+        {"year": "2019-20"},
+    )
+    assert mock_make_request.calls == []
+
+
 async def test_paper_bulk_search_rate_limit_passthrough(mock_make_request, mock_error_response):
     error = mock_error_response(status_code=429)
     mock_make_request.install(papers_api).queue_responses(error)
@@ -232,6 +243,23 @@ async def test_paper_details_empty_paper_id(mock_make_request):
     assert mock_make_request.calls == []
 
 
+@pytest.mark.parametrize(
+    "paper_id",
+    [
+        "abc/citations?limit=1",
+        "abc?fields=title",
+        "abc#frag",
+        "DOI:10.1/x?fields=authors",
+        "URL:https://arxiv.org/abs/2106.15928#frag",
+    ],
+)
+async def test_paper_details_rejects_path_and_query_characters(mock_make_request, paper_id):
+    result = await papers_api.paper_details.fn(None, paper_id=paper_id)
+
+    assert_validation_error(result, "Invalid paper ID format", {"paper_id": paper_id})
+    assert mock_make_request.calls == []
+
+
 async def test_paper_details_404_maps_to_paper_not_found(mock_make_request, mock_error_response):
     mock_make_request.install(papers_api).queue_responses(mock_error_response(status_code=404))
 
@@ -265,6 +293,59 @@ async def test_paper_batch_details_happy_path(mock_make_request):
     )
 
 
+async def test_paper_batch_details_chunks_large_requests(mock_make_request):
+    paper_ids = [f"paper-{i}" for i in range(1200)]
+    mock_make_request.install(papers_api).queue_responses(
+        [{"paperId": i} for i in paper_ids[:500]],
+        [{"paperId": i} for i in paper_ids[500:1000]],
+        [{"paperId": i} for i in paper_ids[1000:]],
+    )
+
+    result = await papers_api.paper_batch_details.fn(None, paper_ids=paper_ids, fields="title")
+
+    assert [paper["paperId"] for paper in result] == paper_ids
+    assert [len(call["json"]["ids"]) for call in mock_make_request.calls] == [500, 500, 200]
+
+
+async def test_paper_batch_details_fills_a_failed_chunk_with_none(mock_make_request, mock_error_response):
+    paper_ids = [f"paper-{i}" for i in range(1200)]
+    mock_make_request.install(papers_api).queue_responses(
+        [{"paperId": i} for i in paper_ids[:500]],
+        mock_error_response(status_code=500),
+        [{"paperId": i} for i in paper_ids[1000:]],
+    )
+
+    result = await papers_api.paper_batch_details.fn(None, paper_ids=paper_ids, fields="title")
+
+    assert len(result) == 1200
+    assert [paper["paperId"] for paper in result[:500] + result[1000:]] == paper_ids[:500] + paper_ids[1000:]
+    assert result[500:1000] == [None] * 500
+
+
+async def test_paper_batch_details_fails_when_every_chunk_fails(mock_make_request, mock_error_response):
+    error = mock_error_response(status_code=500)
+    mock_make_request.install(papers_api).queue_responses(error, error)
+
+    result = await papers_api.paper_batch_details.fn(
+        None, paper_ids=[f"paper-{i}" for i in range(600)], fields="title"
+    )
+
+    assert result == error
+
+
+async def test_paper_batch_details_rejects_malformed_ids(mock_make_request):
+    mock_make_request.install(papers_api)
+
+    result = await papers_api.paper_batch_details.fn(
+        None,
+        paper_ids=["ARXIV:2106.15928", "two words", "ISBN:123", ""],
+        fields="title",
+    )
+
+    assert_validation_error(result, "Invalid paper ID format", {"invalid_indices": [1, 2, 3]})
+    assert mock_make_request.calls == []
+
+
 async def test_paper_batch_details_empty_ids_validation(mock_make_request):
     result = await papers_api.paper_batch_details.fn(None, paper_ids=[], fields="title,year")
 
@@ -554,3 +635,26 @@ async def test_snippet_search_timeout_passthrough(mock_make_request, mock_error_
             "fieldsOfStudy": "Computer Science,Mathematics",
         },
     )
+
+
+async def test_paper_citations_all_fetches_remaining_pages(mock_make_request):
+    mock_make_request.install(papers_api).queue_responses(
+        {"offset": 0, "next": 2, "data": [{"citingPaper": {"paperId": "c1"}}, {"citingPaper": {"paperId": "c2"}}]},
+        {"paperId": "paper-123", "citationCount": 3},
+        {"offset": 2, "data": [{"citingPaper": {"paperId": "c3"}}]},
+    )
+
+    result = await papers_api.paper_citations_all.fn(None, paper_id="paper-123", fields=["title"], limit=2)
+
+    assert result == {
+        "offset": 0,
+        "total": 3,
+        "data": [{"citingPaper": {"paperId": f"c{i}"}} for i in range(1, 4)],
+    }
+    assert [call["endpoint"] for call in mock_make_request.calls] == [
+        "/paper/paper-123/citations",
+        "/paper/paper-123",
+        "/paper/paper-123/citations",
+    ]
+    assert mock_make_request.calls[1]["params"] == {"fields": "citationCount"}
+    assert mock_make_request.calls[2]["params"] == {"offset": 2, "limit": 2, "fields": "title"}
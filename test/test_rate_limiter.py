@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from semantic_scholar.config import RateLimitConfig
@@ -75,3 +77,77 @@ async def test_rate_limiter_detects_recommendations_base_url(monkeypatch):
     )
     assert now == 3.0
 
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_applies_batch_limit_to_batch_endpoints(monkeypatch):
+    monkeypatch.setattr(RateLimitConfig, "BATCH_LIMIT", (1, 4))
+    monkeypatch.setattr(RateLimitConfig, "DEFAULT_LIMIT", (100, 1))
+
+    now = 0.0
+
+    def clock():
+        return now
+
+    async def sleeper(delay: float):
+        nonlocal now
+        now += delay
+
+    rl = RateLimiter(clock=clock, sleeper=sleeper)
+
+    await rl.acquire("/paper/batch", authenticated=True)
+    await rl.acquire("/paper/abc", authenticated=True)
+    assert now == 0.0
+
+    await rl.acquire("/paper/batch", authenticated=True)
+    assert now == 4.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_reserves_slots_for_concurrent_callers(monkeypatch):
+    monkeypatch.setattr(RateLimitConfig, "SEARCH_LIMIT", (1, 2))
+
+    delays = []
+
+    async def sleeper(delay: float):
+        delays.append(delay)
+
+    rl = RateLimiter(clock=lambda: 0.0, sleeper=sleeper)
+
+    await asyncio.gather(*(rl.acquire("/paper/search", authenticated=True) for _ in range(3)))
+    assert delays == [2.0, 4.0]
+
+
+def test_rate_limiter_try_acquire_never_waits(monkeypatch):
+    monkeypatch.setattr(RateLimitConfig, "DEFAULT_LIMIT", (1, 5))
+
+    rl = RateLimiter(clock=lambda: 0.0)
+
+    assert rl.try_acquire("/paper/1", authenticated=True) is True
+    assert rl.try_acquire("/paper/2", authenticated=True) is False
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_hand_back_their_slots(monkeypatch):
+    monkeypatch.setattr(RateLimitConfig, "DEFAULT_LIMIT", (1, 10))
+    delays = []
+
+    async def sleeper(delay: float):
+        delays.append(delay)
+        await asyncio.Event().wait()
+
+    rl = RateLimiter(clock=lambda: 0.0, sleeper=sleeper)
+    await rl.acquire("/paper/1", authenticated=True)
+
+    waiters = [asyncio.create_task(rl.acquire(f"/paper/{i}", authenticated=True)) for i in (2, 3)]
+    await asyncio.sleep(0)
+    for waiter in reversed(waiters):
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+    late = asyncio.create_task(rl.acquire("/paper/4", authenticated=True))
+    await asyncio.sleep(0)
+    late.cancel()
+    await asyncio.gather(late, return_exceptions=True)
+
+    assert delays == [10.0, 20.0, 10.0]
@@ -0,0 +1,37 @@
+import pytest
+
+import semantic_scholar.api  # noqa: F401 - registers the tools
+from semantic_scholar.mcp import mcp
+
+
+pytestmark = pytest.mark.asyncio
+
+
+EXPECTED_TOOLS = {
+    "author_batch_details",
+    "author_details",
+    "author_papers",
+    "author_papers_all",
+    "author_search",
+    "get_paper_recommendations_multi",
+    "get_paper_recommendations_single",
+    "paper_authors",
+    "paper_autocomplete",
+    "paper_batch_details",
+    "paper_bulk_search",
+    "paper_citations",
+    "paper_citations_all",
+    "paper_details",
+    "paper_references",
+    "paper_references_all",
+    "paper_relevance_search",
+    "paper_title_search",
+    "snippet_search",
+}
+
+
+async def test_each_tool_is_registered_exactly_once():
+    tools = await mcp.get_tools()
+
+    assert set(tools) == EXPECTED_TOOLS
+    assert len(tools) == len(EXPECTED_TOOLS)
@@ -0,0 +1,324 @@
+"""Tests for the core transport: request encoding, response caching, in-flight
+sharing, hedging and error replay."""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from semantic_scholar.config import Config
+from semantic_scholar.core.cache import TieredCache, TTLCache
+from semantic_scholar.core.exceptions import S2ApiError, S2RateLimitError
+from semantic_scholar.core import transport
+from semantic_scholar.core.transport import (
+    S2Transport,
+    cleanup_client,
+    error_cache,
+    initialize_client,
+    response_cache,
+)
+
+
+def _make_response(status_code: int, content: bytes = b"{}", method: str = "GET"):
+    return httpx.Response(
+        status_code=status_code,
+        content=content,
+        request=httpx.Request(method, "https://api.semanticscholar.org/graph/v1/paper/batch"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _patch_rate_limiter():
+    with patch("semantic_scholar.core.transport.rate_limiter") as mock_rl:
+        mock_rl.acquire = AsyncMock()
+        yield mock_rl
+
+
+@pytest.fixture(autouse=True)
+def _no_api_key():
+    with patch("semantic_scholar.core.transport.get_api_key", return_value=None):
+        yield
+
+
+@pytest.fixture
+def mock_client():
+    """Stand-in httpx client; tests set ``request.return_value`` or ``side_effect``."""
+    client = AsyncMock()
+    client.request = AsyncMock(return_value=_make_response(200))
+    with patch("semantic_scholar.core.transport.initialize_client", return_value=client):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_post_body_is_sent_as_encoded_json(mock_client):
+    mock_client.request.return_value = _make_response(200, b'[{"paperId": "p1"}]', "POST")
+
+    result = await S2Transport().request_json(
+        "/paper/batch",
+        params={"fields": "title"},
+        method="POST",
+        json={"ids": ["p1"]},
+    )
+
+    assert result == [{"paperId": "p1"}]
+    kwargs = mock_client.request.call_args.kwargs
+    assert kwargs["content"] == b'{"ids":["p1"]}'
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_only_override_keys_are_sent_per_request(mock_client):
+    await S2Transport().request_json("/paper/p1")
+    await S2Transport().request_json("/paper/p1", api_key_override="caller-key")
+
+    first, second = (call.kwargs["headers"] for call in mock_client.request.call_args_list)
+    assert "x-api-key" not in first
+    assert second["x-api-key"] == "caller-key"
+
+
+@pytest.fixture
+def caching(monkeypatch):
+    monkeypatch.setattr(Config, "ENABLE_CACHING", True)
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_author_lookups_are_served_from_cache(caching, mock_client):
+    mock_client.request.return_value = _make_response(200, b'{"authorId": "1741101"}')
+
+    first = await S2Transport().request_json("/author/1741101", params={"fields": "name"})
+    second = await S2Transport().request_json("/author/1741101", params={"fields": "name"})
+
+    assert first == second == {"authorId": "1741101"}
+    assert mock_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_paper_citations_are_cached_per_page(caching, mock_client):
+    mock_client.request.return_value = _make_response(200, b'{"data": []}')
+
+    for offset in (0, 0, 100):
+        await S2Transport().request_json("/paper/p1/citations", params={"offset": offset, "limit": 100})
+
+    assert mock_client.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_paper_search_cache_ignores_query_case_and_spacing(caching, mock_client):
+    mock_client.request.return_value = _make_response(200, b'{"data": []}')
+
+    await S2Transport().request_json("/paper/search", params={"query": "Transformer  attention", "year": "2020"})
+    await S2Transport().request_json("/paper/search", params={"query": "transformer attention ", "year": "2020"})
+    await S2Transport().request_json("/paper/search", params={"query": "transformer attention", "year": "2021"})
+
+    assert mock_client.request.call_count == 2
+    assert mock_client.request.call_args_list[0].kwargs["params"]["query"] == "Transformer  attention"
+
+
+@pytest.mark.asyncio
+async def test_single_paper_recommendations_are_cached(caching, mock_client):
+    mock_client.request.return_value = _make_response(200, b'{"recommendedPapers": []}')
+
+    for _ in range(2):
+        await S2Transport().request_json(
+            "/papers/forpaper/p1",
+            params={"limit": 10, "from": "recent"},
+            base_url=Config.RECOMMENDATIONS_BASE_URL,
+        )
+
+    assert mock_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_author_search_is_not_cached(caching, mock_client):
+    mock_client.request.return_value = _make_response(200, b'{"data": []}')
+
+    await S2Transport().request_json("/author/search", params={"query": "ng"})
+    await S2Transport().request_json("/author/search", params={"query": "ng"})
+
+    assert mock_client.request.call_count == 2
+
+
+def test_ttl_cache_expires_and_evicts():
+    now = 0.0
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None  # least recently used
+    assert cache.get("a") == 1
+
+    now = 10.0
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotes_disk_hits_into_memory(tmp_path):
+    diskcache = pytest.importorskip("diskcache")
+    disk = diskcache.Cache(str(tmp_path))
+    try:
+        await TieredCache(TTLCache(maxsize=8, ttl=10), disk, disk_ttl=60).set("key", {"paperId": "p1"})
+
+        fresh = TieredCache(TTLCache(maxsize=8, ttl=10), disk, disk_ttl=60)
+        assert len(fresh) == 0
+        assert await fresh.get("key") == {"paperId": "p1"}
+        assert len(fresh) == 1
+        assert await fresh.get("missing") is None
+    finally:
+        disk.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_opened_with_the_client(caching, monkeypatch, tmp_path):
+    pytest.importorskip("diskcache")
+    monkeypatch.setattr(Config, "CACHE_DIR", str(tmp_path))
+    assert transport.tiered_cache is None
+
+    await initialize_client()
+    try:
+        assert transport.tiered_cache is not None
+        await transport.tiered_cache.set(("GET", "url", ()), {"paperId": "p1"})
+    finally:
+        await cleanup_client()
+
+    assert transport.tiered_cache is None
+    assert response_cache.get(("GET", "url", ())) == {"paperId": "p1"}
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_request(mock_client):
+    release = asyncio.Event()
+
+    async def slow_request(*args, **kwargs):
+        await release.wait()
+        return _make_response(200, b'{"authorId": "1741101"}')
+
+    mock_client.request.side_effect = slow_request
+
+    calls = [
+        asyncio.create_task(S2Transport().request_json("/author/1741101", params={"fields": "name"}))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert results == [{"authorId": "1741101"}] * 3
+    assert mock_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flight_with_no_callers_left_is_not_reported_unretrieved(mock_client):
+    release = asyncio.Event()
+    unhandled = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+
+    async def failing_request(*args, **kwargs):
+        await release.wait()
+        raise RuntimeError("connection reset")
+
+    mock_client.request.side_effect = failing_request
+
+    caller = asyncio.create_task(S2Transport().request_json("/author/1741101"))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    gc.collect()
+
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_share_only_identical_bodies(mock_client):
+    release = asyncio.Event()
+
+    async def slow_request(*args, **kwargs):
+        await release.wait()
+        return _make_response(200, b"[]", "POST")
+
+    mock_client.request.side_effect = slow_request
+
+    calls = [
+        asyncio.create_task(S2Transport().request_json("/paper/batch", method="POST", json={"ids": ids}))
+        for ids in (["p1"], ["p1"], ["p2"])
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert mock_client.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_get_is_hedged_with_a_backup_request(monkeypatch, _patch_rate_limiter, mock_client):
+    monkeypatch.setattr(Config, "HEDGE_AFTER", 0.01)
+    _patch_rate_limiter.try_acquire.return_value = True
+    stalled = asyncio.Event()
+    responses = iter([b'{"paperId": "slow"}', b'{"paperId": "fast"}'])
+
+    async def request(*args, **kwargs):
+        content = next(responses)
+        if content == b'{"paperId": "slow"}':
+            await stalled.wait()
+        return _make_response(200, content)
+
+    mock_client.request.side_effect = request
+
+    result = await S2Transport().request_json("/paper/p1")
+
+    assert result == {"paperId": "fast"}
+    assert mock_client.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_hedging_waits_when_rate_limiter_has_no_free_slot(monkeypatch, _patch_rate_limiter, mock_client):
+    monkeypatch.setattr(Config, "HEDGE_AFTER", 0.01)
+    _patch_rate_limiter.try_acquire.return_value = False
+
+    async def request(*args, **kwargs):
+        await asyncio.sleep(0.03)
+        return _make_response(200, b'{"paperId": "p1"}')
+
+    mock_client.request.side_effect = request
+
+    result = await S2Transport().request_json("/paper/p1")
+
+    assert result == {"paperId": "p1"}
+    assert mock_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_are_replayed_without_resending(monkeypatch, _patch_rate_limiter, mock_client):
+    monkeypatch.setattr(Config, "ERROR_CACHE_TTL", 60.0)
+    monkeypatch.setattr(S2Transport, "MAX_RETRIES", 0)
+    error_cache.clear()
+    mock_client.request.side_effect = lambda method, url, **kwargs: (
+        _make_response(400) if url.endswith("/bad") else _make_response(429)
+    )
+
+    errors = []
+    try:
+        for _ in range(2):
+            with pytest.raises(S2ApiError) as exc_info:
+                await S2Transport().request_json("/paper/bad")
+            errors.append(exc_info.value)
+            with pytest.raises(S2RateLimitError):
+                await S2Transport().request_json("/paper/busy")
+        with pytest.raises(S2ApiError):
+            await S2Transport().request_json("/paper/bad", params={"fields": "title"})
+    finally:
+        error_cache.clear()
+
+    assert [error.status_code for error in errors] == [400, 400]
+    assert errors[0] is not errors[1]
+    assert mock_client.request.call_count == 3
+    assert _patch_rate_limiter.acquire.await_count == 3